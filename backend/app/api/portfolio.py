@@ -99,7 +99,7 @@ async def upload_pdf(
 ):
     """Parse an uploaded PDF portfolio."""
     content = await file.read()
-    raw_text = _parser.extract_text_from_pdf(content)
+    raw_text = await _parser.extract_text_from_pdf(content)
     portfolio = await _parser.structure_with_llm(raw_text)
     return await _save_portfolio(db, portfolio, raw_text, user)
 
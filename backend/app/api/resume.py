@@ -4,17 +4,19 @@ from __future__ import annotations
 
 import logging
 import uuid
+from collections.abc import AsyncIterator
 
 from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.database import get_db
+from app.db.database import async_session, get_db
 from app.db import crud
 from app.db.models import Resume as ResumeModel, User
 from app.models.schemas import (
     CompanyInfo,
+    JobPosting,
     PortfolioSchema,
     ResumeGenerateRequest,
     ResumeResponse,
@@ -22,7 +24,7 @@ from app.models.schemas import (
 )
 from app.services.auth import get_current_user, get_optional_user
 from app.services.company_crawler import CompanyCrawlerService
-from app.services.resume_generator import ResumeGeneratorService
+from app.services.resume_generator import ResumeGeneratorService, strip_code_fence
 from app.services.pdf_converter import markdown_to_pdf
 
 logger = logging.getLogger(__name__)
@@ -32,6 +34,8 @@ router = APIRouter(prefix="/api/resume", tags=["resume"])
 _crawler = CompanyCrawlerService()
 _generator = ResumeGeneratorService()
 
+_STREAM_MEDIA_TYPE = "text/plain; charset=utf-8"
+
 
 @router.get("/list", response_model=list[ResumeListItem])
 async def list_resumes(
@@ -58,13 +62,10 @@ async def list_resumes(
     return items
 
 
-@router.post("/generate", response_model=ResumeResponse)
-async def generate_resume(
-    req: ResumeGenerateRequest,
-    db: AsyncSession = Depends(get_db),
-    user: User | None = Depends(get_optional_user),
-):
-    """Generate a tailored resume for a specific job posting."""
+async def _load_inputs(
+    req: ResumeGenerateRequest, db: AsyncSession
+) -> tuple[PortfolioSchema, JobPosting]:
+    """Portfolio and job posting for a generate request (404 if missing)."""
     pf_row = await crud.get_portfolio(db, req.portfolio_id)
     if pf_row is None:
         raise HTTPException(status_code=404, detail="Portfolio not found")
@@ -75,65 +76,96 @@ async def generate_resume(
     job = matcher.get_by_id(req.job_id)
     if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
+    return portfolio, job
 
-    # Prevent duplicate: if same user already generated a resume for this job, return it
-    if user:
-        from sqlalchemy import select
-        existing = await db.execute(
-            select(ResumeModel).where(
-                ResumeModel.user_id == user.id,
-                ResumeModel.job_id == req.job_id,
-            )
+
+async def _find_existing(
+    db: AsyncSession, user: User | None, job_id: str
+) -> ResumeModel | None:
+    """The user's earlier resume for this job, if any (duplicate prevention)."""
+    if not user:
+        return None
+    existing = await db.execute(
+        select(ResumeModel).where(
+            ResumeModel.user_id == user.id,
+            ResumeModel.job_id == job_id,
         )
-        existing_row = existing.scalars().first()
-        if existing_row:
-            ci = None
-            if existing_row.company_info_json:
-                try:
-                    from app.models.schemas import CompanyInfo
-                    ci = CompanyInfo.model_validate(existing_row.company_info_json)
-                except Exception:
-                    pass
-            return ResumeResponse(
-                id=existing_row.id,
-                markdown_content=existing_row.markdown_content,
-                company_info=ci,
-                crawl_success=bool(existing_row.crawl_success),
-            )
+    )
+    return existing.scalars().first()
+
 
+async def _crawl_company(
+    req: ResumeGenerateRequest, job: JobPosting
+) -> tuple[CompanyInfo | None, bool]:
     company_url = req.company_url or job.url
-    company_info = None
-    crawl_success = False
     try:
-        company_info, crawl_success = await _crawler.crawl_company(
+        return await _crawler.crawl_company(
             company_name=job.company, company_url=company_url
         )
     except Exception as e:
         logger.warning("Company crawl failed for '%s': %s", job.company, e)
+        return None, False
 
-    try:
-        markdown = await _generator.generate(
-            portfolio=portfolio, job=job, company_info=company_info
-        )
-    except Exception as e:
-        logger.error("Resume generation failed: %s", e)
-        raise HTTPException(status_code=500, detail=f"Resume generation failed: {e}")
-
-    resume_id = uuid.uuid4().hex
-    ci_json = company_info.model_dump() if company_info else None
 
+async def _save_resume(
+    db: AsyncSession,
+    resume_id: str,
+    req: ResumeGenerateRequest,
+    user: User | None,
+    markdown: str,
+    company_info: CompanyInfo | None,
+    crawl_success: bool,
+) -> None:
     row = ResumeModel(
         id=resume_id,
         portfolio_id=req.portfolio_id,
         user_id=user.id if user else None,
         job_id=req.job_id,
         markdown_content=markdown,
-        company_info_json=ci_json,
+        company_info_json=company_info.model_dump() if company_info else None,
         crawl_success=1 if crawl_success else 0,
     )
     db.add(row)
     await db.commit()
-    await db.refresh(row)
+
+
+@router.post("/generate", response_model=ResumeResponse)
+async def generate_resume(
+    req: ResumeGenerateRequest,
+    db: AsyncSession = Depends(get_db),
+    user: User | None = Depends(get_optional_user),
+):
+    """Generate a tailored resume for a specific job posting."""
+    portfolio, job = await _load_inputs(req, db)
+
+    # Prevent duplicate: if same user already generated a resume for this job, return it
+    existing_row = await _find_existing(db, user, req.job_id)
+    if existing_row:
+        ci = None
+        if existing_row.company_info_json:
+            try:
+                ci = CompanyInfo.model_validate(existing_row.company_info_json)
+            except Exception:
+                pass
+        return ResumeResponse(
+            id=existing_row.id,
+            markdown_content=existing_row.markdown_content,
+            company_info=ci,
+            crawl_success=bool(existing_row.crawl_success),
+        )
+
+    company_info, crawl_success = await _crawl_company(req, job)
+
+    try:
+        markdown = await _generator.generate(
+            portfolio=portfolio, job=job, company_info=company_info
+        )
+    except Exception as e:
+        logger.error("Resume generation failed: %s", e)
+        raise HTTPException(status_code=500, detail=f"Resume generation failed: {e}")
+
+    resume_id = uuid.uuid4().hex
+    await _save_resume(db, resume_id, req, user, markdown, company_info, crawl_success)
 
     return ResumeResponse(
         id=resume_id,
@@ -143,6 +175,54 @@ async def generate_resume(
     )
 
 
+@router.post("/generate/stream")
+async def generate_resume_stream(
+    req: ResumeGenerateRequest,
+    db: AsyncSession = Depends(get_db),
+    user: User | None = Depends(get_optional_user),
+):
+    """Streaming variant of /generate: markdown is sent as it is generated.
+
+    The body is plain UTF-8 text and the resume id is in the X-Resume-Id
+    header. The row is stored once the stream completes, so the client
+    fetches GET /{resume_id} afterwards for the final (fence-stripped)
+    markdown and the company info.
+    """
+    portfolio, job = await _load_inputs(req, db)
+
+    existing_row = await _find_existing(db, user, req.job_id)
+    if existing_row:
+        return StreamingResponse(
+            iter([existing_row.markdown_content]),
+            media_type=_STREAM_MEDIA_TYPE,
+            headers={"X-Resume-Id": existing_row.id},
+        )
+
+    company_info, crawl_success = await _crawl_company(req, job)
+    resume_id = uuid.uuid4().hex
+
+    async def body() -> AsyncIterator[str]:
+        parts: list[str] = []
+        try:
+            async for delta in _generator.generate_stream(portfolio, job, company_info):
+                parts.append(delta)
+                yield delta
+        except Exception as e:
+            # Headers are already sent: end the stream without storing a row
+            logger.error("Resume generation failed: %s", e)
+            return
+        # The request's session may already be closed once streaming starts
+        async with async_session() as session:
+            await _save_resume(
+                session, resume_id, req, user,
+                strip_code_fence("".join(parts)), company_info, crawl_success,
+            )
+
+    return StreamingResponse(
+        body(), media_type=_STREAM_MEDIA_TYPE, headers={"X-Resume-Id": resume_id},
+    )
+
+
 @router.get("/{resume_id}", response_model=ResumeResponse)
 async def get_resume(resume_id: str, db: AsyncSession = Depends(get_db)):
     """Retrieve a previously generated resume."""
@@ -24,6 +24,20 @@ class Settings(BaseSettings):
     crawl_enabled: bool = True          # Set CRAWL_ENABLED=false to disable scheduler
     crawl_interval_hours: int = 6       # Batch interval in hours (default: every 6h)
     crawl_keywords: str = "백엔드,프론트엔드,풀스택,데이터엔지니어,AI,머신러닝,DevOps,iOS,Android,QA"
+    # Skip the detail page of cards with at least this many tech tags (0 = always fetch)
+    crawl_detail_skip_min_tags: int = 0
+
+    # LLM response cache (in-process)
+    llm_cache_enabled: bool = True
+    llm_cache_ttl_hours: int = 24
+    # Semantic (embedding-similarity) reuse of portfolio parses. Off by default:
+    # resumes written from the same template can score above the threshold
+    # while belonging to different people.
+    llm_cache_semantic: bool = False
+    llm_cache_semantic_threshold: float = 0.98
+    # Resume generation is cached only when enabled: with the cache on, the
+    # frontend's "다시 생성" button returns the same resume until the TTL ends
+    llm_cache_resumes: bool = False
 
     # CORS origins allowed by the backend (comma-separated in env var)
     cors_origins: list[str] = ["http://localhost:3000"]
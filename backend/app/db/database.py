@@ -1,10 +1,14 @@
+import logging
 import ssl
 
+import orjson
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import DeclarativeBase
 
 from app.config import get_settings
 
+logger = logging.getLogger(__name__)
 settings = get_settings()
 
 # Neon (cloud PostgreSQL) requires SSL; local dev does not
@@ -13,10 +17,19 @@ if "neon.tech" in settings.database_url or "neon" in settings.database_url:
     ssl_ctx = ssl.create_default_context()
     _connect_args["ssl"] = ssl_ctx
 
+
+def _json_serializer(obj: object) -> str:
+    # orjson emits UTF-8 directly (no ensure_ascii escaping of Korean text)
+    return orjson.dumps(obj).decode()
+
+
 engine = create_async_engine(
     settings.database_url,
     echo=False,
     connect_args=_connect_args,
+    # JSONB columns (requirements / preferred / tech stack, portfolios, …)
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
 )
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
@@ -25,6 +38,20 @@ class Base(DeclarativeBase):
     pass
 
 
+async def apply_schema_upgrades(statements: list[str]) -> None:
+    """Run idempotent DDL statements, each in its own transaction.
+
+    A failing statement (e.g. missing privilege for CREATE EXTENSION) is
+    logged and skipped so it never blocks application startup.
+    """
+    for ddl in statements:
+        try:
+            async with engine.begin() as conn:
+                await conn.execute(text(ddl))
+        except Exception as e:
+            logger.warning("Schema upgrade failed (%s): %s", ddl, e)
+
+
 async def get_db() -> AsyncSession:  # type: ignore[misc]
     """Dependency that provides a DB session per request."""
     async with async_session() as session:
@@ -6,6 +6,7 @@ import uuid
 from datetime import datetime, timezone
 
 from sqlalchemy import (
+    BigInteger,
     Column,
     DateTime,
     Float,
@@ -113,16 +114,93 @@ class CrawledJob(Base):
     salary = Column(String(255), nullable=True)
     url = Column(String(1024), nullable=True)
     experience = Column(String(128), nullable=True)    # e.g. "3년 이상"
+    # Inclusive year range parsed from `experience` at crawl time (무관 → 0..99)
+    experience_min_years = Column(Integer, nullable=True)
+    experience_max_years = Column(Integer, nullable=True)
     education = Column(String(128), nullable=True)     # e.g. "대졸 이상"
     employment_type = Column(String(64), nullable=True)  # e.g. "정규직"
     deadline = Column(String(64), nullable=True)       # e.g. "2026-03-31"
     # Extracted tech stack tags for keyword matching
     tech_stack_json = Column(JSONB, default=list)      # list[str]
+    # 64-bit hash of the crawled content; re-crawls with an equal hash skip the UPDATE
+    content_hash = Column(BigInteger, nullable=True)
     crawled_at = Column(DateTime(timezone=True), default=_utcnow)
     # 0=expired/inactive, 1=active
     is_active = Column(Integer, default=1, index=True)
 
 
+# Idempotent DDL applied on startup after Base.metadata.create_all().
+# create_all() never alters tables that already exist, so indexes / columns
+# added after the first deployment are listed here.
+SCHEMA_UPGRADES: list[str] = [
+    # Trigram GIN indexes let the '%keyword%' ILIKE filters in job_fetcher
+    # use an index probe instead of a sequential scan.
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS ix_crawled_jobs_title_trgm "
+    "ON crawled_jobs USING gin (title gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_crawled_jobs_description_trgm "
+    "ON crawled_jobs USING gin (description gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_crawled_jobs_company_trgm "
+    "ON crawled_jobs USING gin (company gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_crawled_jobs_location_trgm "
+    "ON crawled_jobs USING gin (location gin_trgm_ops)",
+    # Numeric experience range replaces the per-year ILIKE experience filter
+    "ALTER TABLE crawled_jobs ADD COLUMN IF NOT EXISTS experience_min_years INTEGER",
+    "ALTER TABLE crawled_jobs ADD COLUMN IF NOT EXISTS experience_max_years INTEGER",
+    "CREATE INDEX IF NOT EXISTS ix_crawled_jobs_active_experience "
+    "ON crawled_jobs (is_active, experience_min_years, experience_max_years, crawled_at DESC)",
+    # Backfill the ranges for rows stored before the columns existed, with the
+    # rules of saramin_crawler._parse_experience_years. Only rows still NULL
+    # are touched, so re-running it on startup is cheap.
+    """
+    UPDATE crawled_jobs AS cj
+    SET experience_min_years = r.lo, experience_max_years = r.hi
+    FROM (
+        SELECT j.id,
+            CASE
+                WHEN j.experience LIKE '%무관%' THEN 0
+                WHEN n.mn IS NOT NULL THEN
+                    CASE
+                        WHEN j.experience LIKE '%신입%' THEN 0
+                        WHEN n.cnt = 1
+                            AND j.experience NOT LIKE '%↑%' AND j.experience NOT LIKE '%이상%'
+                            AND (j.experience LIKE '%↓%' OR j.experience LIKE '%이하%') THEN 0
+                        ELSE n.mn
+                    END
+                WHEN j.experience LIKE '%신입%' THEN 0
+                WHEN j.experience LIKE '%경력%' THEN 1
+            END AS lo,
+            CASE
+                WHEN j.experience LIKE '%무관%' THEN 99
+                WHEN n.mn IS NOT NULL THEN
+                    CASE
+                        WHEN n.cnt = 1
+                            AND (j.experience LIKE '%↑%' OR j.experience LIKE '%이상%') THEN 99
+                        ELSE n.mx
+                    END
+                WHEN j.experience LIKE '%신입%' THEN
+                    CASE WHEN j.experience LIKE '%경력%' THEN 99 ELSE 0 END
+                WHEN j.experience LIKE '%경력%' THEN 99
+            END AS hi
+        FROM crawled_jobs AS j
+        CROSS JOIN LATERAL (
+            SELECT min(CAST(m[1] AS INTEGER)) AS mn, max(CAST(m[1] AS INTEGER)) AS mx,
+                count(*) AS cnt
+            FROM regexp_matches(j.experience, '[0-9]+', 'g') AS m
+        ) AS n
+        WHERE j.experience IS NOT NULL AND j.experience_min_years IS NULL
+    ) AS r
+    WHERE cj.id = r.id AND r.lo IS NOT NULL
+    """,
+    # Newest-active-first listing (fetch_crawled_jobs / count) walks this
+    # partial index in order and stops at LIMIT instead of sorting the table.
+    "CREATE INDEX IF NOT EXISTS ix_crawled_jobs_active_recent "
+    "ON crawled_jobs (crawled_at DESC) WHERE is_active = 1",
+    # Change detection for re-crawled postings (see saramin_crawler._upsert_jobs)
+    "ALTER TABLE crawled_jobs ADD COLUMN IF NOT EXISTS content_hash BIGINT",
+]
+
+
 # ── Portfolio ─────────────────────────────────────────────────
 
 class Portfolio(Base):
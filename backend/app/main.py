@@ -11,7 +11,7 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import get_settings
 from app.api import auth, portfolio, jobs, interview, resume, company, company_candidates
-from app.db.database import engine, Base
+from app.db.database import engine, Base, apply_schema_upgrades
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -65,6 +65,7 @@ async def lifespan(application: FastAPI):
     from app.db import models  # noqa: F401 – registers ORM models
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    await apply_schema_upgrades(models.SCHEMA_UPGRADES)
 
     # Launch background crawl scheduler if enabled
     if settings.crawl_enabled:
@@ -86,6 +87,12 @@ async def lifespan(application: FastAPI):
         except asyncio.CancelledError:
             pass
 
+    from app.services.company_crawler import close_http_client
+    from app.services.portfolio_parser import close_http_clients, shutdown_pdf_pool
+    await close_http_client()
+    await close_http_clients()
+    shutdown_pdf_pool()
+
     await engine.dispose()
 
 
@@ -103,6 +110,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Read by the frontend from /api/resume/generate/stream responses
+    expose_headers=["X-Resume-Id"],
 )
 
 # Register API routers
@@ -136,12 +145,14 @@ async def reset_and_crawl():
     """Delete ALL crawled jobs, then trigger a fresh crawl."""
     from sqlalchemy import text as sa_text
     from app.db.database import async_session as db_session
+    from app.services.job_fetcher import clear_job_cache
     from app.services.saramin_crawler import crawl_all_keywords
 
     async with db_session() as db:
         result = await db.execute(sa_text("DELETE FROM crawled_jobs"))
         deleted = result.rowcount
         await db.commit()
+    clear_job_cache()
 
     asyncio.create_task(crawl_all_keywords())
     return {"deleted": deleted, "status": "crawl_started"}
@@ -168,3 +179,11 @@ async def crawl_status():
             "scheduler_enabled": settings.crawl_enabled,
             "interval_hours": settings.crawl_interval_hours,
         }
+
+
+@app.get("/api/admin/llm-cache/stats")
+async def llm_cache_stats():
+    """Return hit/miss statistics of the in-process LLM response caches."""
+    from app.services.llm_cache import all_stats
+
+    return {"caches": all_stats()}
@@ -0,0 +1,15 @@
+"""Process-wide API client singletons shared by the services."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+from openai import AsyncOpenAI
+
+from app.config import get_settings
+
+
+@lru_cache()
+def openai_client() -> AsyncOpenAI:
+    """Shared AsyncOpenAI client, so every service reuses one connection pool."""
+    return AsyncOpenAI(api_key=get_settings().openai_api_key)
@@ -6,14 +6,15 @@ but in the reverse direction (job → portfolio ranking).
 
 from __future__ import annotations
 
+import base64
 import logging
 from typing import TYPE_CHECKING
 
 import numpy as np
-from openai import AsyncOpenAI
 
 from app.config import get_settings
 from app.models.schemas import CandidateMatchItem, PortfolioSchema
+from app.services._clients import openai_client
 
 if TYPE_CHECKING:
     from app.db.models import CompanyJobPosting, Portfolio
@@ -21,12 +22,9 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-def _cosine_similarity(a: list[float], b: list[float]) -> float:
-    va, vb = np.array(a), np.array(b)
-    denom = np.linalg.norm(va) * np.linalg.norm(vb)
-    if denom == 0:
-        return 0.0
-    return float(np.dot(va, vb) / denom)
+def _cosine_similarity(a: np.ndarray, b: np.ndarray) -> float:
+    """Cosine similarity of two unit-length vectors (see _embed_batch)."""
+    return float(a @ b)
 
 
 class CandidateMatcherService:
@@ -34,25 +32,28 @@ class CandidateMatcherService:
 
     def __init__(self) -> None:
         settings = get_settings()
-        self._client = AsyncOpenAI(api_key=settings.openai_api_key)
+        self._client = openai_client()
         self._embed_model = settings.openai_embedding_model
+        self._has_api_key = bool(settings.openai_api_key)
 
-    async def _embed(self, text: str) -> list[float]:
-        resp = await self._client.embeddings.create(
-            model=self._embed_model,
-            input=text,
-        )
-        return resp.data[0].embedding
+    async def _embed_batch(self, texts: list[str]) -> np.ndarray:
+        """Embed multiple texts in a single API call.
 
-    async def _embed_batch(self, texts: list[str]) -> list[list[float]]:
-        """Embed multiple texts in a single API call."""
+        Returns an (N, D) float32 matrix with L2-normalised rows.
+        """
         if not texts:
-            return []
+            return np.empty((0, 0), dtype=np.float32)
         resp = await self._client.embeddings.create(
             model=self._embed_model,
             input=texts,
+            encoding_format="base64",
         )
-        return [item.embedding for item in sorted(resp.data, key=lambda x: x.index)]
+        mat = np.stack([
+            np.frombuffer(base64.b64decode(item.embedding), dtype=np.float32)
+            for item in sorted(resp.data, key=lambda x: x.index)
+        ])
+        mat /= np.linalg.norm(mat, axis=1, keepdims=True).clip(min=1e-12)
+        return mat
 
     def _job_to_text(self, job: CompanyJobPosting) -> str:
         parts = [job.title]
@@ -95,10 +96,8 @@ class CandidateMatcherService:
         if not portfolios:
             return []
 
-        settings = get_settings()
-
         # Without API key, return unranked list
-        if not settings.openai_api_key:
+        if not self._has_api_key:
             logger.warning("OPENAI_API_KEY not set — returning unranked candidate list")
             items = []
             for i, pf in enumerate(portfolios[:limit]):
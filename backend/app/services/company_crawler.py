@@ -8,20 +8,116 @@ Uses OpenAI gpt-4o-mini for structured extraction.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import logging
+import re
+import time
 from typing import Any
-from urllib.parse import urlparse
+from urllib.parse import quote_plus, urlparse
 
 import httpx
+import orjson
 from bs4 import BeautifulSoup
-from openai import AsyncOpenAI
 
 from app.config import get_settings
 from app.models.schemas import CompanyInfo
+from app.services._clients import openai_client
 
 logger = logging.getLogger(__name__)
 
+# Same-domain pages likely to describe hiring culture / talent profile
+_CANDIDATE_PATHS = ("/recruit", "/careers", "/about", "/company")
+_SEARCH_URL = "https://www.google.com/search?q="
+
+# Elements that never carry company information
+_NOISE_TAGS = frozenset(
+    {"nav", "footer", "header", "script", "style", "noscript", "iframe"}
+)
+
+# Content words: Korean runs of 2+ syllables or Latin words of 3+ letters
+_WORD_RE = re.compile(r"[가-힣]{2,}|[A-Za-z]{3,}")
+# Error / login-gate pages that carry no company information. Only whole
+# error phrases count: a bare "404" or a "로그인" / "Sign in" menu link
+# appears on plenty of real pages
+_GATE_PAGE_RE = re.compile(
+    r"\b404\b[^\n]{0,20}\bnot found\b|\bpage not found\b|"
+    r"페이지를 찾을 수 없|존재하지 않는 페이지|"
+    r"로그인이 필요|로그인 후 이용|\bplease (?:sign|log) in\b|"
+    r"\baccess denied\b|\benable javascript\b",
+    re.IGNORECASE,
+)
+# Low enough for a short Korean 인재상 page: particles stay attached, so a few
+# sentences yield only a dozen or so distinct words
+_MIN_DISTINCT_WORDS = 12
+_MIN_DISTINCT_RATIO = 0.2
+# Gate-page patterns are only trusted on short pages; long pages may mention them in passing
+_GATE_PAGE_MAX_CHARS = 1500
+
+
+def _is_informative(text: str) -> bool:
+    """Cheap heuristic: is the crawled text worth an LLM structuring call?"""
+    text = text.strip()
+    if len(text) <= 100:
+        return False
+    if len(text) < _GATE_PAGE_MAX_CHARS and _GATE_PAGE_RE.search(text):
+        return False
+
+    words = _WORD_RE.findall(text)
+    distinct = len(set(words))
+    if distinct < _MIN_DISTINCT_WORDS:
+        return False
+    # Mostly repeated navigation / boilerplate tokens
+    return distinct / len(words) >= _MIN_DISTINCT_RATIO
+
+
+# Shared keep-alive client: a crawl tries several URLs on the same domain,
+# so reusing pooled connections avoids a TCP + TLS handshake per candidate.
+# HTTP/2 lets those requests multiplex over one connection where supported.
+_CLIENT: httpx.AsyncClient | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = httpx.AsyncClient(
+            http2=True,
+            follow_redirects=True,
+            timeout=20,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+            headers={
+                "User-Agent": (
+                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                    "AppleWebKit/537.36 (KHTML, like Gecko) "
+                    "Chrome/120.0.0.0 Safari/537.36"
+                )
+            },
+        )
+    return _CLIENT
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client (called on application shutdown)."""
+    global _CLIENT
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+        _CLIENT = None
+
+
+# Successful crawl results keyed by normalised (company_name, company_url).
+# Crawl + LLM structuring is the expensive part of resume generation and the
+# same companies come up repeatedly, so results are reused for a day.
+_CRAWL_CACHE_TTL = 24 * 3600
+_CRAWL_CACHE_MAX = 512
+_CRAWL_CACHE: dict[str, tuple[float, CompanyInfo]] = {}
+
+
+def _crawl_cache_key(company_name: str, company_url: str | None) -> str:
+    raw = f"{company_name.strip().lower()}|{(company_url or '').strip().lower()}"
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
 # JSON schema description for structured company info extraction
 _COMPANY_INFO_SCHEMA: dict[str, Any] = {
     "type": "object",
@@ -57,39 +153,42 @@ class CompanyCrawlerService:
 
     def __init__(self) -> None:
         settings = get_settings()
-        self._client = AsyncOpenAI(api_key=settings.openai_api_key)
+        self._client = openai_client()
         self._model = settings.openai_model
 
     async def _fetch_page_text(self, url: str) -> str:
         """Fetch a URL and extract main text content via BeautifulSoup."""
-        async with httpx.AsyncClient(
-            follow_redirects=True,
-            timeout=20,
-            headers={
-                "User-Agent": (
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/120.0.0.0 Safari/537.36"
-                )
-            },
-        ) as client:
-            resp = await client.get(url)
-            resp.raise_for_status()
+        resp = await _get_client().get(url)
+        resp.raise_for_status()
+
+        # HTML parsing is CPU-bound; keep it off the event loop
+        return await asyncio.to_thread(self._parse_html, resp.text)
 
-        soup = BeautifulSoup(resp.text, "html.parser")
+    @staticmethod
+    def _parse_html(html: str) -> str:
+        """Strip noisy elements and return the main text content."""
+        soup = BeautifulSoup(html, "html.parser")
 
-        # Strip noisy elements
-        for tag in soup.find_all(
-            ["nav", "footer", "header", "script", "style", "noscript", "iframe"]
-        ):
-            tag.decompose()
+        # Single traversal: drop noisy elements and remember the first
+        # <main> / <article> seen, instead of find_all + decompose + find.
+        main = article = None
+        for tag in soup.find_all(True):
+            if tag.decomposed:
+                continue  # inside an already removed subtree
+            name = tag.name
+            if name in _NOISE_TAGS:
+                tag.decompose()
+            elif name == "main" and main is None:
+                main = tag
+            elif name == "article" and article is None:
+                article = tag
 
-        main = soup.find("main") or soup.find("article") or soup.find("body")
+        main = main or article or soup.body
         text = main.get_text(separator="\n", strip=True) if main else ""
         # Truncate to avoid excessive token usage
         return text[:8000]
 
-    async def _build_candidate_urls(
+    def _build_candidate_urls(
         self, company_name: str, company_url: str | None
     ) -> list[str]:
         """Build a list of URLs to try crawling for company info."""
@@ -100,14 +199,11 @@ class CompanyCrawlerService:
             # Try to find recruitment / about pages on the same domain
             parsed = urlparse(company_url)
             base = f"{parsed.scheme}://{parsed.netloc}"
-            for path in ["/recruit", "/careers", "/about", "/company"]:
-                urls.append(base + path)
+            urls.extend(base + path for path in _CANDIDATE_PATHS)
 
         # Google search fallback URL (will redirect)
         search_query = f"{company_name} 인재상 채용"
-        urls.append(
-            f"https://www.google.com/search?q={search_query.replace(' ', '+')}"
-        )
+        urls.append(_SEARCH_URL + quote_plus(search_query))
         return urls
 
     async def crawl_company(
@@ -117,17 +213,28 @@ class CompanyCrawlerService:
 
         Tries multiple candidate URLs; first successful crawl is used.
         If all crawls fail, returns (None, False).
+        Successful results are cached for 24h per (company_name, company_url).
         """
-        candidate_urls = await self._build_candidate_urls(company_name, company_url)
+        cache_key = _crawl_cache_key(company_name, company_url)
+        cached = _CRAWL_CACHE.get(cache_key)
+        if cached is not None:
+            expires_at, info = cached
+            if expires_at > time.monotonic():
+                logger.info("Company info cache hit for '%s'", company_name)
+                return info, True
+            del _CRAWL_CACHE[cache_key]
+
+        candidate_urls = self._build_candidate_urls(company_name, company_url)
         raw_text: str | None = None
 
         for url in candidate_urls:
             try:
                 text = await self._fetch_page_text(url)
-                if len(text.strip()) > 100:
+                if _is_informative(text):
                     raw_text = text
                     logger.info("Crawled company page: %s (%d chars)", url, len(text))
                     break
+                logger.debug("Skipping low-information page: %s", url)
             except Exception as e:
                 logger.debug("Failed to crawl %s: %s", url, e)
                 continue
@@ -141,11 +248,16 @@ class CompanyCrawlerService:
         # Use LLM to structure the raw text
         try:
             info = await self._structure_with_llm(company_name, raw_text)
-            return info, True
         except Exception as e:
             logger.error("LLM structuring failed for company '%s': %s", company_name, e)
             return None, False
 
+        if len(_CRAWL_CACHE) >= _CRAWL_CACHE_MAX:
+            # Evict the oldest entry (dicts keep insertion order)
+            del _CRAWL_CACHE[next(iter(_CRAWL_CACHE))]
+        _CRAWL_CACHE[cache_key] = (time.monotonic() + _CRAWL_CACHE_TTL, info)
+        return info, True
+
     async def _structure_with_llm(
         self, company_name: str, raw_text: str
     ) -> CompanyInfo:
@@ -165,6 +277,6 @@ class CompanyCrawlerService:
             temperature=0.1,
         )
 
-        data = json.loads(response.choices[0].message.content or "{}")
+        data = orjson.loads(response.choices[0].message.content or "{}")
         data["raw_text"] = raw_text[:3000]  # store truncated version
         return CompanyInfo.model_validate(data)
@@ -7,13 +7,12 @@ follow-up questions that probe deeper into the candidate's answers.
 
 from __future__ import annotations
 
-import json
 import logging
 import uuid
 from dataclasses import dataclass, field
 from typing import Any
 
-from openai import AsyncOpenAI
+import orjson
 
 from app.config import get_settings
 from app.models.schemas import (
@@ -25,10 +24,29 @@ from app.models.schemas import (
     JobPosting,
     PortfolioSchema,
 )
+from app.services._clients import openai_client
 
 logger = logging.getLogger(__name__)
 
 
+# Interview-type specific guidance appended to the system instruction
+_TYPE_INSTRUCTIONS: dict[str, str] = {
+    "technical": (
+        "Focus on technical depth: ask about system design, algorithms, "
+        "specific technologies the candidate has used, debugging scenarios, "
+        "and architecture decisions in their projects."
+    ),
+    "behavioral": (
+        "Focus on behavioral/situational questions: teamwork, conflict resolution, "
+        "leadership, handling pressure, communication, and past work situations."
+    ),
+    "general": (
+        "Mix technical and behavioral questions. Start with general questions "
+        "and gradually increase depth based on the candidate's responses."
+    ),
+}
+
+
 def _build_system_instruction(
     portfolio: PortfolioSchema,
     job: JobPosting | None,
@@ -57,22 +75,6 @@ def _build_system_instruction(
 - Preferred: {', '.join(job.preferred)}
 """
 
-    type_instructions = {
-        "technical": (
-            "Focus on technical depth: ask about system design, algorithms, "
-            "specific technologies the candidate has used, debugging scenarios, "
-            "and architecture decisions in their projects."
-        ),
-        "behavioral": (
-            "Focus on behavioral/situational questions: teamwork, conflict resolution, "
-            "leadership, handling pressure, communication, and past work situations."
-        ),
-        "general": (
-            "Mix technical and behavioral questions. Start with general questions "
-            "and gradually increase depth based on the candidate's responses."
-        ),
-    }
-
     return f"""\
 You are a professional Korean tech interviewer conducting a {interview_type} interview.
 
@@ -87,7 +89,7 @@ You are a professional Korean tech interviewer conducting a {interview_type} int
 {job_section}
 
 ## Interview Instructions
-{type_instructions.get(interview_type, type_instructions['general'])}
+{_TYPE_INSTRUCTIONS.get(interview_type, _TYPE_INSTRUCTIONS['general'])}
 
 Rules:
 1. Ask ONE question at a time.
@@ -113,6 +115,14 @@ _EVALUATION_SCHEMA: dict[str, Any] = {
 }
 
 
+# Static per-call request parameters (conversation turns vs. final evaluation)
+_CHAT_PARAMS: dict[str, Any] = {"temperature": 0.7}
+_EVAL_PARAMS: dict[str, Any] = {
+    "temperature": 0.3,
+    "response_format": {"type": "json_object"},
+}
+
+
 @dataclass
 class _Session:
     """Internal state for a single interview session."""
@@ -132,7 +142,7 @@ class InterviewAgentService:
 
     def __init__(self) -> None:
         settings = get_settings()
-        self._client = AsyncOpenAI(api_key=settings.openai_api_key)
+        self._client = openai_client()
         self._model = settings.openai_model
         self._sessions: dict[str, _Session] = {}
 
@@ -152,16 +162,11 @@ class InterviewAgentService:
             *session.history,
         ]
 
-        kwargs: dict[str, Any] = {
-            "model": self._model,
-            "messages": messages,
-            "temperature": 0.7,
-        }
-        if json_mode:
-            kwargs["response_format"] = {"type": "json_object"}
-            kwargs["temperature"] = 0.3
-
-        response = await self._client.chat.completions.create(**kwargs)
+        response = await self._client.chat.completions.create(
+            model=self._model,
+            messages=messages,
+            **(_EVAL_PARAMS if json_mode else _CHAT_PARAMS),
+        )
         reply = response.choices[0].message.content or ""
 
         # Append assistant reply to history for next turn
@@ -234,7 +239,7 @@ class InterviewAgentService:
         )
 
         content = await self._chat(session, eval_prompt, json_mode=True)
-        evaluation = json.loads(content)
+        evaluation = orjson.loads(content)
 
         return InterviewEndResponse(
             session_id=session_id,
@@ -6,8 +6,11 @@ External API sources (Saramin Open API, 고용24 WorkNet) have been removed.
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from sqlalchemy import select, or_, func
+import time
+
+from sqlalchemy import Row, select, and_, or_, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models import CrawledJob
@@ -19,9 +22,40 @@ logger = logging.getLogger(__name__)
 # ── DB Crawled Jobs ───────────────────────────────────────────
 
 
-def _crawled_to_posting(row: CrawledJob) -> JobPosting:
-    """Convert a CrawledJob ORM row into a JobPosting schema."""
-    return JobPosting(
+# Only the columns JobPosting needs: avoids hydrating full ORM entities
+# (identity map, attribute instrumentation) and moving unused columns.
+_POSTING_COLUMNS = (
+    CrawledJob.source_id,
+    CrawledJob.title,
+    CrawledJob.company,
+    CrawledJob.location,
+    CrawledJob.description,
+    CrawledJob.requirements_json,
+    CrawledJob.preferred_json,
+    CrawledJob.salary,
+    CrawledJob.url,
+)
+
+# Static base statements, built once at import. Select objects are immutable;
+# per-request filters are applied generatively on top, and SQLAlchemy's
+# compiled cache reuses the SQL string per filter shape.
+_ACTIVE_POSTINGS_QUERY = (
+    select(*_POSTING_COLUMNS)
+    .where(CrawledJob.is_active == 1)
+    .order_by(CrawledJob.crawled_at.desc())
+)
+_ACTIVE_COUNT_QUERY = (
+    select(func.count()).select_from(CrawledJob).where(CrawledJob.is_active == 1)
+)
+
+
+def _crawled_to_posting(row: Row | CrawledJob) -> JobPosting:
+    """Convert a crawled_jobs row (narrow Row or ORM entity) into a JobPosting schema.
+
+    Rows come from our own table and are already well-typed, so validation
+    is skipped with model_construct.
+    """
+    return JobPosting.model_construct(
         id=f"crawled-{row.source_id}",
         title=row.title,
         company=row.company,
@@ -55,16 +89,15 @@ _EXP_YEAR_RANGES: dict[str, tuple[int, int]] = {
 
 
 def _experience_filter(experience_level: str):
-    """Build filter that matches CrawledJob.experience against the given level.
+    """Build filter that matches a job's experience range against the given level.
 
-    Job postings store experience as free text like "경력무관", "신입", "3년 이상", etc.
-    We use ILIKE patterns to match broadly.
+    The crawler parses free-text experience ("신입", "3년↑", "경력 1~3년",
+    "경력무관") into experience_min_years / experience_max_years, so the
+    filter is a single indexable range-overlap comparison.
     """
     if experience_level == "신입":
         return or_(
-            CrawledJob.experience.ilike("%신입%"),
-            CrawledJob.experience.ilike("%무관%"),
-            CrawledJob.experience.ilike("%경력무관%"),
+            CrawledJob.experience_min_years == 0,
             CrawledJob.experience == None,  # noqa: E711
         )
 
@@ -73,17 +106,10 @@ def _experience_filter(experience_level: str):
         return True  # no filter
 
     lo, hi = year_range
-    # Match "무관" (any experience OK) plus patterns containing relevant year numbers
-    clauses = [
-        CrawledJob.experience.ilike("%무관%"),
-        CrawledJob.experience.ilike("%경력무관%"),
-    ]
-    for y in range(lo, min(hi + 1, 16)):
-        clauses.append(CrawledJob.experience.ilike(f"%{y}년%"))
-    if experience_level == "신입":
-        clauses.append(CrawledJob.experience.ilike("%신입%"))
-
-    return or_(*clauses)
+    return and_(
+        CrawledJob.experience_min_years <= hi,
+        CrawledJob.experience_max_years >= lo,
+    )
 
 
 def _location_filter(locations: list[str]):
@@ -109,14 +135,10 @@ async def fetch_crawled_jobs(
     """Query active crawled jobs from DB with optional keyword/experience/location filters.
 
     Uses ILIKE on title/description/company for broad keyword matching.
-    experience: e.g. "신입", "1~3년" — matches against CrawledJob.experience column.
+    experience: e.g. "신입", "1~3년" — range-matched against the parsed experience years.
     locations: e.g. ["서울", "경기"] — OR-matched against CrawledJob.location column.
     """
-    query = (
-        select(CrawledJob)
-        .where(CrawledJob.is_active == 1)
-        .order_by(CrawledJob.crawled_at.desc())
-    )
+    query = _ACTIVE_POSTINGS_QUERY
 
     if keywords:
         query = query.where(_keyword_filter(keywords))
@@ -130,13 +152,12 @@ async def fetch_crawled_jobs(
     query = query.offset(offset).limit(limit)
 
     result = await db.execute(query)
-    rows = result.scalars().all()
-    return [_crawled_to_posting(r) for r in rows]
+    return [_crawled_to_posting(r) for r in result]
 
 
 async def count_active_crawled_jobs(db: AsyncSession, keywords: str = "") -> int:
     """Return the total number of active crawled jobs in DB."""
-    query = select(func.count()).select_from(CrawledJob).where(CrawledJob.is_active == 1)
+    query = _ACTIVE_COUNT_QUERY
     if keywords:
         query = query.where(_keyword_filter(keywords))
     result = await db.execute(query)
@@ -145,6 +166,32 @@ async def count_active_crawled_jobs(db: AsyncSession, keywords: str = "") -> int
 
 # ── Combined fetcher ──────────────────────────────────────────
 
+# Short-lived in-process cache for fetch_all_jobs. Recommendation and search
+# re-request the same filtered pools many times while crawled data only
+# changes once per crawl cycle (see clear_job_cache).
+_POOL_CACHE_TTL = 300
+_POOL_CACHE_MAX = 256
+_POOL_CACHE: dict[tuple, tuple[float, list[JobPosting]]] = {}
+# Per-key locks coalesce concurrent misses into a single DB query
+_POOL_LOCKS: dict[tuple, asyncio.Lock] = {}
+
+
+def _pool_cache_get(key: tuple) -> list[JobPosting] | None:
+    cached = _POOL_CACHE.get(key)
+    if cached is None:
+        return None
+    expires_at, jobs = cached
+    if expires_at <= time.monotonic():
+        del _POOL_CACHE[key]
+        return None
+    return jobs
+
+
+def clear_job_cache() -> None:
+    """Drop cached job pools (called after the crawled_jobs table changes)."""
+    _POOL_CACHE.clear()
+
+
 
 async def fetch_all_jobs(
     keywords: str = "",
@@ -157,18 +204,37 @@ async def fetch_all_jobs(
 
     Returns whatever crawled jobs are available — no external API fallback.
     Supports optional experience/location pre-filtering at DB level.
+    Results are cached in-process for a few minutes per filter combination.
     """
     if db is None:
         logger.warning("No DB session provided; returning empty job list")
         return []
 
-    try:
-        jobs = await fetch_crawled_jobs(
-            db, keywords=keywords, limit=count_each * 2,
-            experience=experience, locations=locations,
-        )
-        logger.info("Returning %d crawled jobs from DB (exp=%s, loc=%s)", len(jobs), experience, locations)
-        return jobs
-    except Exception as e:
-        logger.error("Failed to query crawled jobs: %s", e)
-        return []
+    key = (keywords, count_each, experience, tuple(locations) if locations else None)
+    jobs = _pool_cache_get(key)
+    if jobs is not None:
+        logger.debug("Job pool cache hit (kw=%r, exp=%s, loc=%s)", keywords, experience, locations)
+        return list(jobs)
+
+    lock = _POOL_LOCKS.setdefault(key, asyncio.Lock())
+    async with lock:
+        # Another request may have filled the cache while we waited
+        jobs = _pool_cache_get(key)
+        if jobs is None:
+            try:
+                jobs = await fetch_crawled_jobs(
+                    db, keywords=keywords, limit=count_each * 2,
+                    experience=experience, locations=locations,
+                )
+            except Exception as e:
+                logger.error("Failed to query crawled jobs: %s", e)
+                return []
+            finally:
+                _POOL_LOCKS.pop(key, None)
+
+            logger.info("Returning %d crawled jobs from DB (exp=%s, loc=%s)", len(jobs), experience, locations)
+            if len(_POOL_CACHE) >= _POOL_CACHE_MAX:
+                del _POOL_CACHE[next(iter(_POOL_CACHE))]
+            _POOL_CACHE[key] = (time.monotonic() + _POOL_CACHE_TTL, jobs)
+
+    return list(jobs)
@@ -10,28 +10,60 @@ Uses OpenAI text-embedding-3-small for embeddings.
 
 from __future__ import annotations
 
+import asyncio
+import base64
+import hashlib
 import logging
 
 import numpy as np
-from openai import AsyncOpenAI
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import get_settings
 from app.models.schemas import PortfolioSchema, JobPosting
 from app.services.job_fetcher import fetch_all_jobs
+from app.services._clients import openai_client
 
 logger = logging.getLogger(__name__)
 
 # Runtime lookup cache for job detail pages / interview linkage
 _JOBS_BY_ID: dict[str, JobPosting] = {}
 
+# Embedding text and its _EMB_CACHE digest per job id, tagged with a content
+# fingerprint so edited postings are rebuilt. str hashes are memoised, so the
+# check is cheap for the same pooled JobPosting objects.
+_JOB_TEXT_CACHE: dict[str, tuple[int, str, bytes]] = {}
+# Job texts shorter than this (title + company only) are not embedded
+_MIN_EMBED_TEXT_LEN = 40
+# Lowercased searchable text per job id for keyword search, same scheme
+_SEARCH_BLOB_CACHE: dict[str, tuple[int, str]] = {}
 
-def _cosine_similarity(a: list[float], b: list[float]) -> float:
-    va, vb = np.array(a), np.array(b)
-    denom = np.linalg.norm(va) * np.linalg.norm(vb)
-    if denom == 0:
-        return 0.0
-    return float(np.dot(va, vb) / denom)
+# Embedding vectors keyed by a digest of the embedded text. Crawled job texts
+# barely change between requests, so only new/edited texts hit the API.
+_EMB_CACHE_MAX = 4096
+_EMB_CACHE: dict[bytes, np.ndarray] = {}
+
+
+def _text_key(text: str) -> bytes:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+def _job_fingerprint(job: JobPosting) -> int:
+    return hash((
+        job.title, job.company, job.description,
+        tuple(job.requirements), tuple(job.preferred),
+    ))
+
+
+def _search_blob(job: JobPosting) -> str:
+    fp = _job_fingerprint(job)
+    cached = _SEARCH_BLOB_CACHE.get(job.id)
+    if cached is not None and cached[0] == fp:
+        return cached[1]
+    blob = "\n".join(
+        [job.title, job.company, job.description or "", *job.requirements, *job.preferred]
+    ).lower()
+    _SEARCH_BLOB_CACHE[job.id] = (fp, blob)
+    return blob
 
 
 class JobMatcherService:
@@ -39,27 +71,58 @@ class JobMatcherService:
 
     def __init__(self) -> None:
         settings = get_settings()
-        self._client = AsyncOpenAI(api_key=settings.openai_api_key)
+        self._client = openai_client()
         self._embed_model = settings.openai_embedding_model
+        self._has_api_key = bool(settings.openai_api_key)
 
-    async def _embed(self, text: str) -> list[float]:
-        """Embed a single text string."""
-        resp = await self._client.embeddings.create(
-            model=self._embed_model,
-            input=text,
-        )
-        return resp.data[0].embedding
+    async def _embed_batch(self, texts: list[str]) -> np.ndarray:
+        """Embed multiple texts in a single API call (batch).
 
-    async def _embed_batch(self, texts: list[str]) -> list[list[float]]:
-        """Embed multiple texts in a single API call (batch)."""
+        Returns an (N, D) float32 matrix with L2-normalised rows, so cosine
+        similarity is a plain dot product.
+        """
         if not texts:
-            return []
+            return np.empty((0, 0), dtype=np.float32)
         resp = await self._client.embeddings.create(
             model=self._embed_model,
             input=texts,
+            # Raw little-endian float32 bytes: decoded straight into the
+            # matrix instead of via a per-float Python list
+            encoding_format="base64",
         )
         # OpenAI returns embeddings sorted by index
-        return [item.embedding for item in sorted(resp.data, key=lambda x: x.index)]
+        mat = np.stack([
+            np.frombuffer(base64.b64decode(item.embedding), dtype=np.float32)
+            for item in sorted(resp.data, key=lambda x: x.index)
+        ])
+        mat /= np.linalg.norm(mat, axis=1, keepdims=True).clip(min=1e-12)
+        return mat
+
+    async def _fill_missing(
+        self,
+        texts: list[str],
+        keys: list[bytes],
+        vecs: list[np.ndarray | None],
+        miss_idx: list[int],
+    ) -> np.ndarray:
+        """Embed the texts at miss_idx, cache them, and stack all vectors."""
+        if miss_idx:
+            mat = await self._embed_batch([texts[i] for i in miss_idx])
+            for i, row in zip(miss_idx, mat):
+                vecs[i] = row
+                if len(_EMB_CACHE) >= _EMB_CACHE_MAX:
+                    del _EMB_CACHE[next(iter(_EMB_CACHE))]
+                # A copy, not a view: a view would keep the whole batch matrix alive
+                _EMB_CACHE[keys[i]] = row.copy()
+            logger.debug("Embedding cache: %d/%d texts embedded", len(miss_idx), len(texts))
+        return np.stack(vecs)
+
+    async def _embed_cached(self, texts: list[str]) -> np.ndarray:
+        """Embed texts, calling the API only for texts not seen before."""
+        keys = [_text_key(t) for t in texts]
+        vecs = [_EMB_CACHE.get(k) for k in keys]
+        miss_idx = [i for i, v in enumerate(vecs) if v is None]
+        return await self._fill_missing(texts, keys, vecs, miss_idx)
 
     def _portfolio_to_text(self, portfolio: PortfolioSchema) -> str:
         """Flatten portfolio into a single text blob for embedding."""
@@ -89,6 +152,17 @@ class JobMatcherService:
             parts.append("Preferred: " + ", ".join(job.preferred))
         return "\n".join(parts)
 
+    def _job_text_cached(self, job: JobPosting) -> tuple[str, bytes]:
+        """Embedding text and its digest, rebuilt only when the job changes."""
+        fp = _job_fingerprint(job)
+        cached = _JOB_TEXT_CACHE.get(job.id)
+        if cached is not None and cached[0] == fp:
+            return cached[1], cached[2]
+        text = self._job_to_text(job)
+        key = _text_key(text)
+        _JOB_TEXT_CACHE[job.id] = (fp, text, key)
+        return text, key
+
     async def _get_job_pool(
         self,
         keywords: str = "",
@@ -108,6 +182,37 @@ class JobMatcherService:
 
         return jobs
 
+    async def _resolve_pool(
+        self,
+        db: AsyncSession | None,
+        exp: str | None,
+        locs: list[str] | None,
+    ) -> list[JobPosting]:
+        """Fetch the filtered pool, relaxing filters if it is too small (<5)."""
+        # Try filtered pool first
+        pool = await self._get_job_pool(keywords="", db=db, experience=exp, locations=locs)
+
+        # Fallback: if filtered pool is too small, relax filters progressively
+        if len(pool) < 5:
+            if exp and locs:
+                # Try location-only
+                pool = await self._get_job_pool(keywords="", db=db, locations=locs)
+            if len(pool) < 5:
+                # Fully unfiltered fallback
+                pool = await self._get_job_pool(keywords="", db=db)
+                logger.info("Filter fallback: using unfiltered pool (%d jobs)", len(pool))
+        return pool
+
+    async def _embed_portfolio(self, text: str) -> np.ndarray | None:
+        """Embed the portfolio text; None without an API key or on API failure."""
+        if not self._has_api_key:
+            return None
+        try:
+            return (await self._embed_cached([text]))[0]
+        except Exception as e:
+            logger.error("Portfolio embedding failed: %s", e)
+            return None
+
     async def recommend(
         self,
         portfolio: PortfolioSchema,
@@ -121,59 +226,83 @@ class JobMatcherService:
         Applies experience/location pre-filtering when provided.
         Falls back to unfiltered pool if filtered results are too few (<5).
         """
-        settings = get_settings()
-
         # Resolve filters: explicit params override portfolio fields
         exp = experience_level or portfolio.experience_level
         locs = preferred_locations if preferred_locations else (portfolio.preferred_locations or None)
 
-        # Try filtered pool first
-        pool = await self._get_job_pool(keywords="", db=db, experience=exp, locations=locs)
-
-        # Fallback: if filtered pool is too small, relax filters progressively
-        if len(pool) < 5:
-            if exp and locs:
-                # Try location-only
-                pool = await self._get_job_pool(keywords="", db=db, locations=locs)
-            if len(pool) < 5:
-                # Fully unfiltered fallback
-                pool = await self._get_job_pool(keywords="", db=db)
-                logger.info("Filter fallback: using unfiltered pool (%d jobs)", len(pool))
+        # The portfolio embedding doesn't depend on the pool, so overlap the
+        # embeddings round trip with the DB queries
+        portfolio_text = self._portfolio_to_text(portfolio)
+        embed_task = asyncio.create_task(self._embed_portfolio(portfolio_text))
+        try:
+            pool = await self._resolve_pool(db, exp, locs)
+        except BaseException:
+            embed_task.cancel()
+            await asyncio.gather(embed_task, return_exceptions=True)
+            raise
 
         if not pool:
+            # Nothing to rank: don't wait for (or pay for) the embedding
+            embed_task.cancel()
+            await asyncio.gather(embed_task, return_exceptions=True)
             logger.warning("No crawled jobs available for recommendation")
             return []
+        portfolio_vec = await embed_task
 
         # Without API key, return pool as-is (no embedding ranking)
-        if not settings.openai_api_key:
+        if not self._has_api_key:
             logger.warning("OPENAI_API_KEY not set — returning unranked job list")
             return pool[:limit]
-
-        portfolio_text = self._portfolio_to_text(portfolio)
-
-        # Build all texts: portfolio + all jobs → single batch embedding call
-        job_texts = [self._job_to_text(job) for job in pool]
-        all_texts = [portfolio_text] + job_texts
-
-        try:
-            all_embeddings = await self._embed_batch(all_texts)
-        except Exception as e:
-            logger.error("Batch embedding failed: %s", e)
+        if portfolio_vec is None:
             return pool[:limit]
 
-        portfolio_emb = all_embeddings[0]
-        job_embeddings = all_embeddings[1:]
-
-        scored: list[tuple[float, JobPosting]] = []
-        for job, job_emb in zip(pool, job_embeddings):
-            score = _cosine_similarity(portfolio_emb, job_emb)
-            scored.append((score, job))
-
-        scored.sort(key=lambda x: x[0], reverse=True)
+        # Title-only stubs carry too little text to rank meaningfully: don't
+        # spend embedding tokens on them, list them after the ranked jobs
+        # One pass builds (cached) text + digest and probes the embedding cache
+        rich: list[JobPosting] = []
+        rich_texts: list[str] = []
+        rich_keys: list[bytes] = []
+        rich_vecs: list[np.ndarray | None] = []
+        miss_idx: list[int] = []
+        stubs: list[JobPosting] = []
+        for job in pool:
+            text, key = self._job_text_cached(job)
+            if len(text) < _MIN_EMBED_TEXT_LEN:
+                stubs.append(job)
+                continue
+            vec = _EMB_CACHE.get(key)
+            if vec is None:
+                miss_idx.append(len(rich))
+            rich.append(job)
+            rich_texts.append(text)
+            rich_keys.append(key)
+            rich_vecs.append(vec)
 
         results: list[JobPosting] = []
-        for score, job in scored[:limit]:
-            results.append(job.model_copy(update={"similarity_score": round(score, 4)}))
+        if rich:
+            try:
+                job_mat = await self._fill_missing(rich_texts, rich_keys, rich_vecs, miss_idx)
+            except Exception as e:
+                logger.error("Batch embedding failed: %s", e)
+                return pool[:limit]
+
+            # Rows are unit-length, so one mat-vec product gives every cosine score
+            scores = job_mat @ portfolio_vec
+
+            # Top-k: O(N) partition, then sort only the k winners
+            k = min(limit, len(scores))
+            if k > 0:
+                top = np.argpartition(-scores, k - 1)[:k]
+                order = top[np.argsort(-scores[top])]
+                results = [
+                    rich[i].model_copy(update={"similarity_score": round(float(scores[i]), 4)})
+                    for i in order
+                ]
+
+        remaining = max(limit - len(results), 0)
+        results.extend(
+            job.model_copy(update={"similarity_score": 0.0}) for job in stubs[:remaining]
+        )
         return results
 
     async def search(
@@ -193,13 +322,7 @@ class JobMatcherService:
             return []
 
         kw = keyword.lower()
-        matched = [
-            j for j in pool
-            if kw in j.title.lower()
-            or kw in (j.description or "").lower()
-            or any(kw in r.lower() for r in j.requirements)
-            or any(kw in p.lower() for p in j.preferred)
-        ] or pool
+        matched = [j for j in pool if kw in _search_blob(j)] or pool
 
         return matched[:limit]
 
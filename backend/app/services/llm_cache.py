@@ -0,0 +1,153 @@
+"""In-process cache for LLM responses.
+
+Two lookup tiers:
+  1. Exact — sha256 of (namespace, prompt) → stored response.
+  2. Semantic (optional) — the prompt's embedding is compared against the
+     embeddings of stored prompts; a cosine score above the threshold reuses
+     that response.
+
+Entries expire after a TTL and the oldest entry is evicted when full.
+Hit/miss counters are exposed through stats(); all_stats() collects them
+from every cache instance for the admin endpoint.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+EmbedFn = Callable[[str], Awaitable[np.ndarray]]
+
+# Every live cache by namespace, for all_stats()
+_REGISTRY: dict[str, LLMCache] = {}
+
+
+@dataclass(slots=True)
+class _Entry:
+    expires_at: float
+    value: str
+    vector: np.ndarray | None = None
+
+
+class LLMCache:
+    """Caches string responses (e.g. validated model JSON) per prompt.
+
+    `embed` must return an L2-normalised float32 vector; it is only used when
+    a semantic threshold is given.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        ttl_seconds: int = 24 * 3600,
+        max_entries: int = 512,
+        embed: EmbedFn | None = None,
+        semantic_threshold: float | None = None,
+    ) -> None:
+        self.namespace = namespace
+        self._ttl = ttl_seconds
+        self._max = max_entries
+        self._embed = embed if semantic_threshold is not None else None
+        self._threshold = semantic_threshold
+        self._entries: dict[bytes, _Entry] = {}
+        self._hits = 0
+        self._semantic_hits = 0
+        self._misses = 0
+        _REGISTRY[namespace] = self
+
+    def _digest(self, prompt: str) -> bytes:
+        return hashlib.sha256(f"{self.namespace}\0{prompt}".encode("utf-8")).digest()
+
+    def _get_exact(self, digest: bytes, now: float) -> _Entry | None:
+        entry = self._entries.get(digest)
+        if entry is None:
+            return None
+        if entry.expires_at <= now:
+            del self._entries[digest]
+            return None
+        return entry
+
+    def _get_semantic(self, vector: np.ndarray, now: float) -> _Entry | None:
+        candidates = [
+            e for e in self._entries.values()
+            if e.vector is not None and e.expires_at > now
+        ]
+        if not candidates:
+            return None
+        scores = np.stack([e.vector for e in candidates]) @ vector
+        best = int(np.argmax(scores))
+        if scores[best] >= self._threshold:
+            return candidates[best]
+        return None
+
+    async def _embed_prompt(self, prompt: str) -> np.ndarray | None:
+        if self._embed is None:
+            return None
+        try:
+            return await self._embed(prompt)
+        except Exception as e:
+            logger.warning("LLM cache [%s]: embedding failed, semantic tier skipped: %s", self.namespace, e)
+            return None
+
+    async def get_or_compute(
+        self,
+        prompt: str,
+        compute: Callable[[], Awaitable[str]],
+        embed_text: str | None = None,
+    ) -> str:
+        """Return the cached response for prompt, or compute and store it.
+
+        embed_text, when given, is embedded for the semantic tier instead of
+        the prompt (e.g. to keep every distinguishing part inside the
+        embedding input). Exceptions from compute propagate and nothing is
+        cached.
+        """
+        now = time.monotonic()
+        digest = self._digest(prompt)
+
+        entry = self._get_exact(digest, now)
+        if entry is not None:
+            self._hits += 1
+            return entry.value
+
+        vector = await self._embed_prompt(prompt if embed_text is None else embed_text)
+        if vector is not None:
+            entry = self._get_semantic(vector, now)
+            if entry is not None:
+                self._hits += 1
+                self._semantic_hits += 1
+                return entry.value
+
+        self._misses += 1
+        value = await compute()
+
+        if len(self._entries) >= self._max:
+            del self._entries[next(iter(self._entries))]
+        self._entries[digest] = _Entry(time.monotonic() + self._ttl, value, vector)
+        return value
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int | float | str]:
+        total = self._hits + self._misses
+        return {
+            "namespace": self.namespace,
+            "entries": len(self._entries),
+            "hits": self._hits,
+            "semantic_hits": self._semantic_hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / total, 4) if total else 0.0,
+        }
+
+
+def all_stats() -> list[dict[str, int | float | str]]:
+    """Stats of every LLM cache created in this process."""
+    return [cache.stats() for cache in _REGISTRY.values()]
@@ -6,35 +6,62 @@ them into a clean PDF with Korean font support (Malgun Gothic / fallback).
 
 from __future__ import annotations
 
-import io
+import functools
 import logging
 import os
 import re
 from pathlib import Path
 
-from fpdf import FPDF
+from fpdf import FPDF, XPos, YPos
 
 logger = logging.getLogger(__name__)
 
 # Candidate Korean-capable TrueType font paths (Windows priority)
-_FONT_CANDIDATES = [
+_FONT_CANDIDATES = (
     r"C:\Windows\Fonts\malgun.ttf",          # Malgun Gothic (맑은 고딕)
     r"C:\Windows\Fonts\NanumGothic.ttf",      # NanumGothic
     "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",   # Linux
     "/usr/share/fonts/naver-nanum/NanumGothic.ttf",
-]
+)
 
-_BOLD_FONT_CANDIDATES = [
+_BOLD_FONT_CANDIDATES = (
     r"C:\Windows\Fonts\malgunbd.ttf",
     r"C:\Windows\Fonts\NanumGothicBold.ttf",
     "/usr/share/fonts/truetype/nanum/NanumGothicBold.ttf",
     "/usr/share/fonts/naver-nanum/NanumGothicBold.ttf",
-]
-
-
-def _find_font(candidates: list[str]) -> str | None:
+)
+
+_HR_RE = re.compile(r"^-{3,}$|^\*{3,}$|^_{3,}$")
+_BOLD_SPLIT_RE = re.compile(r"(\*\*[^*]+\*\*)")
+
+# Heading marker → (font size, underline)
+_HEADING_STYLES: dict[str, tuple[int, bool]] = {
+    "#": (18, True),
+    "##": (14, False),
+    "###": (12, False),
+}
+
+
+def _list_font_dir(parent: str) -> frozenset[str]:
+    """Case-normalised names of the files in a font directory (empty if missing)."""
+    try:
+        with os.scandir(parent) as entries:
+            return frozenset(os.path.normcase(e.name) for e in entries if e.is_file())
+    except OSError:
+        return frozenset()
+
+
+# Installed fonts don't change while the process runs; resolve each list once
+@functools.lru_cache(maxsize=4)
+def _find_font(candidates: tuple[str, ...]) -> str | None:
+    # Candidates share a few parent directories: list each one once and
+    # check names against the listing instead of stat-ing every path
+    listings: dict[str, frozenset[str]] = {}
     for path in candidates:
-        if os.path.isfile(path):
+        parent, name = os.path.split(path)
+        if parent not in listings:
+            listings[parent] = _list_font_dir(parent) if parent else frozenset()
+        if os.path.normcase(name) in listings[parent]:
             return path
     return None
 
@@ -92,19 +119,15 @@ def markdown_to_pdf(markdown_text: str) -> bytes:
             pdf.ln(3)
             continue
 
-        # Headings
-        if line.startswith("### "):
-            _render_heading(pdf, line[4:].strip(), size=12)
-            continue
-        if line.startswith("## "):
-            _render_heading(pdf, line[3:].strip(), size=14)
-            continue
-        if line.startswith("# "):
-            _render_heading(pdf, line[2:].strip(), size=18, underline=True)
+        # Headings: classify by the leading marker in one lookup
+        marker, sep, rest = line.partition(" ")
+        if sep and marker in _HEADING_STYLES:
+            size, underline = _HEADING_STYLES[marker]
+            _render_heading(pdf, rest.strip(), size=size, underline=underline)
             continue
 
         # Horizontal rule
-        if re.match(r"^-{3,}$|^\*{3,}$|^_{3,}$", line.strip()):
+        if _HR_RE.match(line.strip()):
             y = pdf.get_y()
             pdf.line(pdf.l_margin, y, pdf.w - pdf.r_margin, y)
             pdf.ln(4)
@@ -120,9 +143,8 @@ def markdown_to_pdf(markdown_text: str) -> bytes:
         # Regular paragraph
         _render_paragraph(pdf, line)
 
-    buf = io.BytesIO()
-    pdf.output(buf)
-    return buf.getvalue()
+    # fpdf2 builds the document in a bytearray; convert it once for Response
+    return bytes(pdf.output())
 
 
 def _render_heading(
@@ -160,9 +182,17 @@ def _write_rich_line(pdf: _ResumePDF, text: str, width: float = 0) -> None:
     """Write a line supporting **bold** inline markers."""
     w = width if width > 0 else (pdf.w - pdf.l_margin - pdf.r_margin)
 
+    # Most lines have no bold: lay them out in one call, skipping the split
+    if "**" not in text:
+        pdf.multi_cell(w, 5, text, new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+        pdf.ln(1)
+        return
+
     # Split on **bold** markers
-    parts = re.split(r"(\*\*[^*]+\*\*)", text)
+    parts = _BOLD_SPLIT_RE.split(text)
     for part in parts:
+        if not part:
+            continue
         if part.startswith("**") and part.endswith("**"):
             pdf._set_bold()
             pdf.write(5, part[2:-2])
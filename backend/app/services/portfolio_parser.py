@@ -9,95 +9,70 @@ Pipeline:
 
 from __future__ import annotations
 
+import asyncio
+import base64
 import io
 import json
 import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from typing import Any
 
+import fitz  # PyMuPDF
 import httpx
-import pdfplumber
-from bs4 import BeautifulSoup
-from openai import AsyncOpenAI
+import lxml.html
+import numpy as np
+import orjson
+from lxml import etree
 
 from app.config import get_settings
 from app.models.schemas import PortfolioSchema
+from app.services.llm_cache import LLMCache
+from app.services._clients import openai_client
 
 logger = logging.getLogger(__name__)
 
-# JSON schema description embedded in the system prompt for structured output
-_PORTFOLIO_JSON_SCHEMA: dict[str, Any] = {
-    "type": "object",
-    "properties": {
-        "name": {"type": "string", "nullable": True},
-        "contact": {
-            "type": "object",
-            "properties": {
-                "email":    {"type": "string", "nullable": True},
-                "phone":    {"type": "string", "nullable": True},
-                "linkedin": {"type": "string", "nullable": True},
-                "website":  {"type": "string", "nullable": True},
-            },
-        },
-        "summary": {"type": "string", "nullable": True},
-        "skills": {
-            "type": "array",
-            "items": {
-                "type": "object",
-                "properties": {
-                    "name":        {"type": "string"},
-                    "category":    {"type": "string", "nullable": True},
-                    "proficiency": {"type": "string", "nullable": True},
-                },
-            },
-        },
-        "experiences": {
-            "type": "array",
-            "items": {
-                "type": "object",
-                "properties": {
-                    "company":     {"type": "string"},
-                    "role":        {"type": "string"},
-                    "period":      {"type": "string", "nullable": True},
-                    "description": {"type": "string", "nullable": True},
-                },
-            },
-        },
-        "projects": {
-            "type": "array",
-            "items": {
-                "type": "object",
-                "properties": {
-                    "name":        {"type": "string"},
-                    "description": {"type": "string", "nullable": True},
-                    "tech_stack":  {"type": "array", "items": {"type": "string"}},
-                    "role":        {"type": "string", "nullable": True},
-                    "highlights":  {"type": "array", "items": {"type": "string"}},
-                },
-            },
-        },
-        "education": {
-            "type": "array",
-            "items": {
-                "type": "object",
-                "properties": {
-                    "institution": {"type": "string"},
-                    "degree":      {"type": "string", "nullable": True},
-                    "major":       {"type": "string", "nullable": True},
-                    "period":      {"type": "string", "nullable": True},
-                },
-            },
-        },
-        "certifications": {"type": "array", "items": {"type": "string"}},
-        "keywords":       {"type": "array", "items": {"type": "string"}},
-        "experience_level": {"type": "string", "nullable": True},
-        "preferred_locations": {"type": "array", "items": {"type": "string"}},
-    },
-    "required": [
-        "name", "contact", "summary", "skills", "experiences",
-        "projects", "education", "certifications", "keywords",
-        "experience_level", "preferred_locations",
-    ],
-}
+def _adapt_schema(node: dict[str, Any], defs: dict[str, Any]) -> dict[str, Any]:
+    """Turn a pydantic JSON-schema node into the compact prompt dialect.
+
+    Inlines $ref / single-item allOf, drops title / default, and rewrites
+    Optional fields (anyOf [T, null]) as T with "nullable": true.
+    """
+    if "$ref" in node:
+        return _adapt_schema(defs[node["$ref"].rsplit("/", 1)[-1]], defs)
+    if len(node.get("allOf", ())) == 1:
+        return _adapt_schema(node["allOf"][0], defs)
+    any_of = node.get("anyOf")
+    if any_of:
+        variants = [v for v in any_of if v.get("type") != "null"]
+        if len(variants) == 1 and len(variants) < len(any_of):
+            return {**_adapt_schema(variants[0], defs), "nullable": True}
+
+    out: dict[str, Any] = {}
+    for key, value in node.items():
+        if key in ("title", "default", "$defs"):
+            continue
+        if key == "properties":
+            out[key] = {name: _adapt_schema(sub, defs) for name, sub in value.items()}
+        elif key == "items":
+            out[key] = _adapt_schema(value, defs)
+        else:
+            out[key] = value
+    return out
+
+
+def _build_portfolio_json_schema() -> dict[str, Any]:
+    raw = PortfolioSchema.model_json_schema()
+    schema = _adapt_schema(raw, raw.get("$defs", {}))
+    # Every top-level field must be present in the output (null / [] when unknown)
+    schema["required"] = list(schema["properties"])
+    return schema
+
+
+# JSON schema embedded in the system prompt for structured output, derived
+# once at import from PortfolioSchema so the two cannot drift apart
+_PORTFOLIO_JSON_SCHEMA: dict[str, Any] = _build_portfolio_json_schema()
 
 _SYSTEM_PROMPT = f"""\
 You are a professional resume/portfolio analyst.
@@ -118,51 +93,362 @@ Rules:
 """
 
 
+# ── Shared HTTP clients ───────────────────────────────────────
+
+# Long-lived pooled clients: connections (TLS sessions, HTTP/2 streams to
+# api.github.com) are reused across requests instead of rebuilt per call.
+_HTTP_CLIENT: httpx.AsyncClient | None = None
+_GITHUB_CLIENT: httpx.AsyncClient | None = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None:
+        _HTTP_CLIENT = httpx.AsyncClient(
+            http2=True,
+            follow_redirects=True,
+            timeout=30,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+        )
+    return _HTTP_CLIENT
+
+
+def _get_github_client() -> httpx.AsyncClient:
+    global _GITHUB_CLIENT
+    if _GITHUB_CLIENT is None:
+        settings = get_settings()
+        headers: dict[str, str] = {"Accept": "application/vnd.github+json"}
+        if settings.github_token:
+            headers["Authorization"] = f"Bearer {settings.github_token}"
+        _GITHUB_CLIENT = httpx.AsyncClient(
+            base_url="https://api.github.com",
+            headers=headers,
+            http2=True,
+            timeout=30,
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+        )
+    return _GITHUB_CLIENT
+
+
+# Last 200 response per GitHub request, revalidated with If-None-Match.
+# 304 replies don't count against the API rate limit.
+_ETAG_CACHE_MAX = 1024
+_ETAG_CACHE: dict[tuple, tuple[str, httpx.Response]] = {}
+
+
+async def _github_get(
+    path: str, params: dict[str, Any] | None = None, accept: str | None = None
+) -> httpx.Response:
+    """GET against the GitHub API, reusing the cached body on 304 Not Modified."""
+    key = (path, tuple(sorted(params.items())) if params else (), accept)
+    headers: dict[str, str] = {"Accept": accept} if accept else {}
+    cached = _ETAG_CACHE.get(key)
+    if cached is not None:
+        headers["If-None-Match"] = cached[0]
+
+    resp = await _get_github_client().get(path, params=params, headers=headers)
+    if resp.status_code == 304 and cached is not None:
+        return cached[1]
+
+    etag = resp.headers.get("ETag")
+    if resp.status_code == 200 and etag:
+        if key not in _ETAG_CACHE and len(_ETAG_CACHE) >= _ETAG_CACHE_MAX:
+            del _ETAG_CACHE[next(iter(_ETAG_CACHE))]
+        _ETAG_CACHE[key] = (etag, resp)
+    return resp
+
+
+# Only this much of each README is kept for the LLM prompt
+_README_MAX_CHARS = 2000
+_README_ACCEPT = "application/vnd.github.raw+json"
+# path → (ETag, truncated README text)
+_README_CACHE: dict[str, tuple[str, str]] = {}
+
+
+async def _github_readme(path: str) -> str | None:
+    """Fetch the first _README_MAX_CHARS characters of a README.
+
+    The body is streamed and the connection released once enough text has
+    been decoded, so large READMEs are never downloaded in full. Returns
+    None when the repository has no README.
+    """
+    headers = {"Accept": _README_ACCEPT}
+    cached = _README_CACHE.get(path)
+    if cached is not None:
+        headers["If-None-Match"] = cached[0]
+
+    async with _get_github_client().stream("GET", path, headers=headers) as resp:
+        if resp.status_code == 304 and cached is not None:
+            return cached[1]
+        if resp.status_code != 200:
+            return None
+        chunks: list[str] = []
+        total = 0
+        async for chunk in resp.aiter_text():
+            chunks.append(chunk)
+            total += len(chunk)
+            if total >= _README_MAX_CHARS:
+                break
+        etag = resp.headers.get("ETag")
+
+    text = "".join(chunks)[:_README_MAX_CHARS]
+    if etag:
+        if path not in _README_CACHE and len(_README_CACHE) >= _ETAG_CACHE_MAX:
+            del _README_CACHE[next(iter(_README_CACHE))]
+        _README_CACHE[path] = (etag, text)
+    return text
+
+
+# Profile + top non-fork repos + languages + README in a single request.
+# GraphQL needs a token, so unauthenticated calls stay on the REST path.
+_GITHUB_PROFILE_QUERY = """\
+query($login: String!, $n: Int!) {
+  user(login: $login) {
+    name bio company websiteUrl location
+    repositories(privacy: PUBLIC) { totalCount }
+    topRepos: repositories(
+      first: $n, isFork: false, ownerAffiliations: OWNER,
+      orderBy: {field: STARGAZERS, direction: DESC}
+    ) {
+      nodes {
+        name description stargazerCount
+        primaryLanguage { name }
+        languages(first: 10, orderBy: {field: SIZE, direction: DESC}) { nodes { name } }
+        readme: object(expression: "HEAD:README.md") { ... on Blob { text } }
+        readmeLower: object(expression: "HEAD:readme.md") { ... on Blob { text } }
+        readmeRst: object(expression: "HEAD:README.rst") { ... on Blob { text } }
+        readmePlain: object(expression: "HEAD:README") { ... on Blob { text } }
+        readmeDocs: object(expression: "HEAD:docs/README.md") { ... on Blob { text } }
+      }
+    }
+  }
+}"""
+# README aliases in _GITHUB_PROFILE_QUERY, in order of preference (GraphQL
+# has no equivalent of REST /readme's file-name discovery)
+_README_ALIASES = ("readme", "readmeLower", "readmeRst", "readmePlain", "readmeDocs")
+
+
+async def _github_graphql(query: str, variables: dict[str, Any]) -> dict[str, Any]:
+    """POST a GraphQL query and return its data, mapping errors to ValueError."""
+    resp = await _get_github_client().post(
+        "/graphql", json={"query": query, "variables": variables},
+    )
+    if resp.status_code == 401:
+        raise ValueError(
+            "GitHub API 인증 실패입니다. GITHUB_TOKEN 환경변수를 확인해 주세요."
+        )
+    resp.raise_for_status()
+    body = orjson.loads(resp.content)
+    errors = body.get("errors") or []
+    if any(e.get("type") == "NOT_FOUND" for e in errors):
+        raise ValueError(f"GitHub 사용자 '{variables.get('login')}'을(를) 찾을 수 없습니다.")
+    if any(e.get("type") == "RATE_LIMITED" for e in errors):
+        raise ValueError("GitHub API rate limit 초과. 잠시 후 재시도해 주세요.")
+    if errors and not body.get("data"):
+        raise ValueError(f"GitHub GraphQL 오류: {errors[0].get('message', '')}")
+    return body["data"]
+
+
+def _format_repo_entry(
+    name: str,
+    description: str | None,
+    language: str | None,
+    stars: int,
+    languages: list[str],
+    readme: str | None,
+) -> str:
+    entry = f"\n## Repository: {name}"
+    if description:
+        entry += f"\nDescription: {description}"
+    if language:
+        entry += f"\nPrimary language: {language}"
+    entry += f"\nStars: {stars}"
+    if languages:
+        entry += f"\nLanguages: {', '.join(languages)}"
+    # README (first 2000 chars)
+    if readme is not None:
+        entry += f"\nREADME:\n{readme}"
+    return entry
+
+
+async def close_http_clients() -> None:
+    """Close the shared HTTP clients (called on application shutdown)."""
+    global _HTTP_CLIENT, _GITHUB_CLIENT
+    for client in (_HTTP_CLIENT, _GITHUB_CLIENT):
+        if client is not None:
+            await client.aclose()
+    _HTTP_CLIENT = _GITHUB_CLIENT = None
+
+
+# ── PDF extraction workers ────────────────────────────────────
+
+# Documents with at least this many pages are split across worker processes;
+# below it, process start-up and copying the bytes cost more than they save.
+_PDF_PARALLEL_MIN_PAGES = 8
+_PDF_POOL_WORKERS = min(4, os.cpu_count() or 1)
+_PDF_POOL: ProcessPoolExecutor | None = None
+# PyMuPDF is not thread-safe, so in-process fitz calls (page counts and short
+# documents) all go through one dedicated thread instead of asyncio.to_thread
+_PDF_THREAD: ThreadPoolExecutor | None = None
+
+
+def _get_pdf_pool() -> ProcessPoolExecutor:
+    global _PDF_POOL
+    if _PDF_POOL is None:
+        # spawn, not fork: forking the threaded server process can leave
+        # workers deadlocked on locks held by other threads at fork time
+        _PDF_POOL = ProcessPoolExecutor(
+            max_workers=_PDF_POOL_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _PDF_POOL
+
+
+def _get_pdf_thread() -> ThreadPoolExecutor:
+    global _PDF_THREAD
+    if _PDF_THREAD is None:
+        _PDF_THREAD = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pdf")
+    return _PDF_THREAD
+
+
+def shutdown_pdf_pool() -> None:
+    """Stop the PDF workers (called on application shutdown)."""
+    global _PDF_POOL, _PDF_THREAD
+    if _PDF_POOL is not None:
+        _PDF_POOL.shutdown(cancel_futures=True)
+        _PDF_POOL = None
+    if _PDF_THREAD is not None:
+        _PDF_THREAD.shutdown(cancel_futures=True)
+        _PDF_THREAD = None
+
+
+def _pdf_page_count(pdf_bytes: bytes) -> int:
+    with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+        return doc.page_count
+
+
+def _extract_pdf_pages(
+    pdf_bytes: bytes, start: int, stop: int, extract_tables: bool = False
+) -> str:
+    """Text of pages [start, stop), optionally tables as ' | ' rows.
+
+    Module-level so it pickles.
+
+    Parts are written straight into one buffer separated by blank lines,
+    instead of collecting a list and joining it afterwards.
+    """
+    buf = io.StringIO()
+    sep = ""
+    with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+        for page in doc.pages(start, stop):
+            page_text = page.get_text("text").strip()
+            if page_text:
+                buf.write(sep)
+                buf.write(page_text)
+                sep = "\n\n"
+
+            # Table detection is the slowest step and get_text() already
+            # includes cell contents, so it only runs when asked for
+            if not extract_tables:
+                continue
+            for table in page.find_tables().tables:
+                for row in table.extract():
+                    buf.write(sep)
+                    buf.write(" | ".join(c or "" for c in row))
+                    sep = "\n\n"
+    return buf.getvalue()
+
+
+# Max in-flight GitHub API requests while fetching per-repo details
+_GITHUB_CONCURRENCY = 8
+
+# Stop adding repositories once the GitHub text reaches this size; later
+# (lower-starred) READMEs add LLM input tokens for little extra signal
+_GITHUB_TEXT_MAX_CHARS = 50_000
+
+# Embedding input limit for the semantic cache tier (well under the model's token cap)
+_CACHE_EMBED_MAX_CHARS = 6000
+
+
 class PortfolioParserService:
     """Handles multi-source portfolio text extraction and LLM structuring."""
 
     def __init__(self) -> None:
         settings = get_settings()
-        self._client = AsyncOpenAI(api_key=settings.openai_api_key)
+        self._client = openai_client()
         self._model = settings.openai_model
+        self._embed_model = settings.openai_embedding_model
+        self._cache: LLMCache | None = None
+        if settings.llm_cache_enabled:
+            self._cache = LLMCache(
+                f"portfolio:{self._model}",
+                ttl_seconds=settings.llm_cache_ttl_hours * 3600,
+                embed=self._embed_for_cache,
+                semantic_threshold=(
+                    settings.llm_cache_semantic_threshold if settings.llm_cache_semantic else None
+                ),
+            )
 
     # ── 1. Text extraction per source ──────────────────────────
 
-    def extract_text_from_pdf(self, pdf_bytes: bytes) -> str:
-        """Extract text content from PDF bytes using pdfplumber."""
-        text_parts: list[str] = []
-        with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text_parts.append(page_text)
+    async def extract_text_from_pdf(
+        self, pdf_bytes: bytes, extract_tables: bool = False
+    ) -> str:
+        """Extract text content from PDF bytes using PyMuPDF.
 
-                # Also extract tables and convert to readable text
-                for table in page.extract_tables():
-                    for row in table:
-                        cells = [c or "" for c in row]
-                        text_parts.append(" | ".join(cells))
+        Runs off the event loop on the single PDF thread; long documents are
+        split into page ranges parsed in parallel worker processes. Set
+        extract_tables to also emit detected tables as ' | '-joined rows.
+        """
+        loop = asyncio.get_running_loop()
+        pdf_thread = _get_pdf_thread()
+        page_count = await loop.run_in_executor(pdf_thread, _pdf_page_count, pdf_bytes)
+        if page_count < _PDF_PARALLEL_MIN_PAGES:
+            return await loop.run_in_executor(
+                pdf_thread, _extract_pdf_pages, pdf_bytes, 0, page_count, extract_tables
+            )
 
-        return "\n\n".join(text_parts)
+        pool = _get_pdf_pool()
+        step = -(-page_count // _PDF_POOL_WORKERS)
+        chunks = await asyncio.gather(*(
+            loop.run_in_executor(
+                pool, _extract_pdf_pages,
+                pdf_bytes, start, min(start + step, page_count), extract_tables,
+            )
+            for start in range(0, page_count, step)
+        ))
+        return "\n\n".join(chunk for chunk in chunks if chunk)
 
     async def extract_text_from_url(self, url: str) -> str:
         """Crawl a portfolio website and extract main content."""
-        async with httpx.AsyncClient(follow_redirects=True, timeout=30) as client:
-            resp = await client.get(url)
-            resp.raise_for_status()
-
-        soup = BeautifulSoup(resp.text, "html.parser")
-
-        # Remove noise elements
-        for tag in soup.find_all(["nav", "footer", "header", "script", "style", "noscript"]):
-            tag.decompose()
+        resp = await _get_http_client().get(url)
+        resp.raise_for_status()
+
+        if not resp.content.strip():
+            return ""
+        # Decode with the charset httpx resolved, as resp.text would
+        parser = lxml.html.HTMLParser(encoding=resp.encoding)
+        tree = lxml.html.fromstring(resp.content, parser=parser)
+
+        # Remove noise elements in one C-level pass (tail text is kept)
+        etree.strip_elements(
+            tree, etree.Comment,
+            "nav", "footer", "header", "script", "style", "noscript",
+            with_tail=False,
+        )
 
-        # Prefer main content areas
-        main = soup.find("main") or soup.find("article") or soup.find("body")
-        if main is None:
-            return soup.get_text(separator="\n", strip=True)
+        # Prefer main content areas (explicit None checks: an element
+        # without children is falsy)
+        root = tree.find(".//main")
+        if root is None:
+            root = tree.find(".//article")
+        if root is None:
+            # <body>, not the whole document: keeps <head> / <title> text out
+            root = tree.find(".//body")
+        if root is None:
+            root = tree
 
-        return main.get_text(separator="\n", strip=True)
+        return "\n".join(t for t in (text.strip() for text in root.itertext()) if t)
 
     async def extract_text_from_github(self, username: str, max_repos: int = 10) -> str:
         """Pull profile bio, top repositories, READMEs, and language stats.
@@ -170,82 +456,148 @@ class PortfolioParserService:
         Falls back gracefully when unauthenticated rate limit (60 req/hr) is hit.
         Set GITHUB_TOKEN env var to raise the limit to 5000 req/hr.
         """
-        settings = get_settings()
-        headers: dict[str, str] = {"Accept": "application/vnd.github+json"}
-        if settings.github_token:
-            headers["Authorization"] = f"Bearer {settings.github_token}"
+        if get_settings().github_token:
+            return await self._extract_github_graphql(username, max_repos)
 
         parts: list[str] = []
 
-        async with httpx.AsyncClient(base_url="https://api.github.com", headers=headers, timeout=30) as gh:
-            # User profile
-            user_resp = await gh.get(f"/users/{username}")
-            if user_resp.status_code == 401:
-                raise ValueError(
-                    "GitHub API 인증 실패입니다. GITHUB_TOKEN 환경변수를 설정해 주세요. "
-                    "https://github.com/settings/tokens 에서 토큰 발급 후 "
-                    "backend/.env 의 GITHUB_TOKEN 항목에 추가하면 됩니다."
-                )
-            if user_resp.status_code == 403:
-                remaining = user_resp.headers.get("X-RateLimit-Remaining", "?")
-                raise ValueError(
-                    f"GitHub API rate limit 초과(남은 횟수: {remaining}). "
-                    "잠시 후 재시도하거나 GITHUB_TOKEN을 설정해 주세요."
-                )
-            if user_resp.status_code == 404:
-                raise ValueError(
-                    f"GitHub 사용자 '{username}'을(를) 찾을 수 없습니다. "
-                    "사용자명(username)만 입력했는지 확인해 주세요."
-                )
-            user_resp.raise_for_status()
-
-            user = user_resp.json()
-            parts.append(f"Name: {user.get('name', username)}")
-            if user.get("bio"):
-                parts.append(f"Bio: {user['bio']}")
-            if user.get("company"):
-                parts.append(f"Company: {user['company']}")
-            if user.get("blog"):
-                parts.append(f"Blog: {user['blog']}")
-            if user.get("location"):
-                parts.append(f"Location: {user['location']}")
-            if user.get("public_repos"):
-                parts.append(f"Public repos: {user['public_repos']}")
-
-            # Repositories sorted by stars
-            repos_resp = await gh.get(
-                f"/users/{username}/repos",
-                params={"sort": "stars", "direction": "desc", "per_page": max_repos},
+        # User profile
+        user_resp = await _github_get(f"/users/{username}")
+        if user_resp.status_code == 401:
+            raise ValueError(
+                "GitHub API 인증 실패입니다. GITHUB_TOKEN 환경변수를 설정해 주세요. "
+                "https://github.com/settings/tokens 에서 토큰 발급 후 "
+                "backend/.env 의 GITHUB_TOKEN 항목에 추가하면 됩니다."
             )
-            repos = repos_resp.json() if repos_resp.status_code == 200 else []
-
-            for repo in repos:
-                if repo.get("fork"):
-                    continue
-                entry = f"\n## Repository: {repo['name']}"
-                if repo.get("description"):
-                    entry += f"\nDescription: {repo['description']}"
-                if repo.get("language"):
-                    entry += f"\nPrimary language: {repo['language']}"
-                entry += f"\nStars: {repo.get('stargazers_count', 0)}"
-
-                # Fetch languages breakdown
-                lang_resp = await gh.get(f"/repos/{username}/{repo['name']}/languages")
-                if lang_resp.status_code == 200:
-                    langs = lang_resp.json()
-                    if langs:
-                        entry += f"\nLanguages: {', '.join(langs.keys())}"
-
-                # Fetch README (first 2000 chars)
-                readme_resp = await gh.get(
-                    f"/repos/{username}/{repo['name']}/readme",
-                    headers={"Accept": "application/vnd.github.raw+json"},
-                )
-                if readme_resp.status_code == 200:
-                    readme_text = readme_resp.text[:2000]
-                    entry += f"\nREADME:\n{readme_text}"
+        if user_resp.status_code == 403:
+            remaining = user_resp.headers.get("X-RateLimit-Remaining", "?")
+            raise ValueError(
+                f"GitHub API rate limit 초과(남은 횟수: {remaining}). "
+                "잠시 후 재시도하거나 GITHUB_TOKEN을 설정해 주세요."
+            )
+        if user_resp.status_code == 404:
+            raise ValueError(
+                f"GitHub 사용자 '{username}'을(를) 찾을 수 없습니다. "
+                "사용자명(username)만 입력했는지 확인해 주세요."
+            )
+        user_resp.raise_for_status()
+
+        user = user_resp.json()
+        parts.append(f"Name: {user.get('name', username)}")
+        if user.get("bio"):
+            parts.append(f"Bio: {user['bio']}")
+        if user.get("company"):
+            parts.append(f"Company: {user['company']}")
+        if user.get("blog"):
+            parts.append(f"Blog: {user['blog']}")
+        if user.get("location"):
+            parts.append(f"Location: {user['location']}")
+        if user.get("public_repos"):
+            parts.append(f"Public repos: {user['public_repos']}")
+
+        # Repositories sorted by stars
+        repos_resp = await _github_get(
+            f"/users/{username}/repos",
+            params={"sort": "stars", "direction": "desc", "per_page": max_repos},
+        )
+        repos = repos_resp.json() if repos_resp.status_code == 200 else []
+        repos = [repo for repo in repos if not repo.get("fork")]
+
+        # Languages + README for every repo, fetched concurrently
+        sem = asyncio.Semaphore(_GITHUB_CONCURRENCY)
+
+        async def bounded_get(path: str) -> httpx.Response:
+            async with sem:
+                return await _github_get(path)
+
+        async def bounded_readme(path: str) -> str | None:
+            async with sem:
+                return await _github_readme(path)
 
+        async def repo_details(name: str) -> tuple[httpx.Response, str | None]:
+            lang_resp, readme_text = await asyncio.gather(
+                bounded_get(f"/repos/{username}/{name}/languages"),
+                bounded_readme(f"/repos/{username}/{name}/readme"),
+            )
+            return lang_resp, readme_text
+
+        # Consumed in star order; once the text budget is spent the
+        # remaining requests are cancelled
+        tasks = [asyncio.create_task(repo_details(repo["name"])) for repo in repos]
+        total_chars = sum(len(p) for p in parts)
+        try:
+            for repo, task in zip(repos, tasks):
+                lang_resp, readme_text = await task
+                langs = lang_resp.json() if lang_resp.status_code == 200 else {}
+                entry = _format_repo_entry(
+                    repo["name"],
+                    repo.get("description"),
+                    repo.get("language"),
+                    repo.get("stargazers_count", 0),
+                    list(langs),
+                    readme_text,
+                )
                 parts.append(entry)
+                total_chars += len(entry)
+                if total_chars >= _GITHUB_TEXT_MAX_CHARS:
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        return "\n".join(parts)
+
+    async def _extract_github_graphql(self, username: str, max_repos: int) -> str:
+        """Token-authenticated variant of extract_text_from_github.
+
+        Forks are filtered server-side and languages / READMEs come back in
+        the same response, so the whole profile costs one request.
+        """
+        data = await _github_graphql(
+            _GITHUB_PROFILE_QUERY, {"login": username, "n": max_repos},
+        )
+        user = data.get("user")
+        if user is None:
+            raise ValueError(
+                f"GitHub 사용자 '{username}'을(를) 찾을 수 없습니다. "
+                "사용자명(username)만 입력했는지 확인해 주세요."
+            )
+
+        parts: list[str] = [f"Name: {user.get('name') or username}"]
+        if user.get("bio"):
+            parts.append(f"Bio: {user['bio']}")
+        if user.get("company"):
+            parts.append(f"Company: {user['company']}")
+        if user.get("websiteUrl"):
+            parts.append(f"Blog: {user['websiteUrl']}")
+        if user.get("location"):
+            parts.append(f"Location: {user['location']}")
+        public_repos = user["repositories"]["totalCount"]
+        if public_repos:
+            parts.append(f"Public repos: {public_repos}")
+
+        total_chars = sum(len(p) for p in parts)
+        for repo in user["topRepos"]["nodes"]:
+            if total_chars >= _GITHUB_TEXT_MAX_CHARS:
+                break
+            readme_text = next(
+                (
+                    blob["text"] for blob in (repo.get(alias) for alias in _README_ALIASES)
+                    if blob and blob.get("text") is not None
+                ),
+                None,
+            )
+            entry = _format_repo_entry(
+                repo["name"],
+                repo.get("description"),
+                (repo.get("primaryLanguage") or {}).get("name"),
+                repo.get("stargazerCount", 0),
+                [lang["name"] for lang in repo["languages"]["nodes"]],
+                readme_text[:_README_MAX_CHARS] if readme_text is not None else None,
+            )
+            parts.append(entry)
+            total_chars += len(entry)
 
         return "\n".join(parts)
 
@@ -254,8 +606,20 @@ class PortfolioParserService:
     async def structure_with_llm(self, raw_text: str) -> PortfolioSchema:
         """Send raw text to OpenAI and get a structured PortfolioSchema.
 
-        Uses JSON mode to guarantee valid JSON output.
+        Uses JSON mode to guarantee valid JSON output. Results are cached per
+        input text, so re-uploading the same portfolio skips the LLM call.
         """
+        if self._cache is None:
+            return await self._structure(raw_text)
+        dump = await self._cache.get_or_compute(
+            raw_text.strip(), lambda: self._structure_json(raw_text)
+        )
+        return PortfolioSchema.model_validate_json(dump)
+
+    async def _structure_json(self, raw_text: str) -> str:
+        return (await self._structure(raw_text)).model_dump_json()
+
+    async def _structure(self, raw_text: str) -> PortfolioSchema:
         response = await self._client.chat.completions.create(
             model=self._model,
             messages=[
@@ -266,5 +630,15 @@ class PortfolioParserService:
             temperature=0.1,
         )
 
-        data = json.loads(response.choices[0].message.content or "{}")
-        return PortfolioSchema.model_validate(data)
+        # Parse and validate in one pydantic-core pass, no intermediate dict
+        return PortfolioSchema.model_validate_json(response.choices[0].message.content or "{}")
+
+    async def _embed_for_cache(self, text: str) -> np.ndarray:
+        """Normalised embedding of (the start of) a portfolio text for the semantic cache tier."""
+        resp = await self._client.embeddings.create(
+            model=self._embed_model,
+            input=text[:_CACHE_EMBED_MAX_CHARS],
+            encoding_format="base64",
+        )
+        vec = np.frombuffer(base64.b64decode(resp.data[0].embedding), dtype=np.float32)
+        return vec / max(float(np.linalg.norm(vec)), 1e-12)
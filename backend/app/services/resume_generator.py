@@ -8,15 +8,30 @@ Uses OpenAI gpt-4o-mini for generation.
 
 from __future__ import annotations
 
+import base64
 import logging
+import re
+from collections.abc import AsyncIterator
 
-from openai import AsyncOpenAI
+import numpy as np
 
 from app.config import get_settings
 from app.models.schemas import CompanyInfo, JobPosting, PortfolioSchema
+from app.services.llm_cache import LLMCache
+from app.services._clients import openai_client
 
 logger = logging.getLogger(__name__)
 
+# Whole-response ```lang ... ``` wrapper the model sometimes adds
+_FENCE_RE = re.compile(r"\A```[^\n]*\n(.*?)\n```\s*\Z", re.DOTALL)
+
+_TEMPERATURE = 0.4
+# Semantic cache tier input: a bounded slice of each part, so the job and
+# company always fall inside the embedding, however long the portfolio is
+_CACHE_EMBED_PORTFOLIO_CHARS = 4000
+_CACHE_EMBED_JOB_CHARS = 1000
+_CACHE_EMBED_COMPANY_CHARS = 1000
+
 _SYSTEM_PROMPT = """\
 You are an expert career consultant and resume writer.
 Given a candidate's portfolio data, a target job posting, and optionally
@@ -42,27 +57,64 @@ a polished, professional resume in **Markdown** format.
 """
 
 
+def strip_code_fence(markdown: str) -> str:
+    """Remove a ```lang wrapper the model sometimes puts around the whole resume."""
+    markdown = markdown.strip()
+    m = _FENCE_RE.match(markdown)
+    if m:
+        return m.group(1)
+    if markdown.startswith("```"):
+        # Cut off at max_tokens before the closing fence: drop the opening line
+        return markdown.partition("\n")[2]
+    return markdown
+
+
+def _cache_embed_text(
+    portfolio: PortfolioSchema,
+    job: JobPosting,
+    company_info: CompanyInfo | None,
+) -> str:
+    """Embedding input for the semantic tier: portfolio, job and company slices."""
+    parts = [
+        portfolio.model_dump_json(exclude_none=True)[:_CACHE_EMBED_PORTFOLIO_CHARS],
+        f"{job.company} / {job.title}\n{(job.description or '')[:_CACHE_EMBED_JOB_CHARS]}",
+    ]
+    if company_info:
+        parts.append(
+            company_info.model_dump_json(exclude={"raw_text"}, exclude_none=True)
+            [:_CACHE_EMBED_COMPANY_CHARS]
+        )
+    return "\n\n".join(parts)
+
+
 class ResumeGeneratorService:
     """Generates tailored markdown resumes via OpenAI LLM."""
 
     def __init__(self) -> None:
         settings = get_settings()
-        self._client = AsyncOpenAI(api_key=settings.openai_api_key)
+        self._client = openai_client()
         self._model = settings.openai_model
+        self._embed_model = settings.openai_embedding_model
+        self._cache: LLMCache | None = None
+        if settings.llm_cache_enabled and settings.llm_cache_resumes:
+            self._cache = LLMCache(
+                f"resume:{self._model}:{_TEMPERATURE}",
+                ttl_seconds=settings.llm_cache_ttl_hours * 3600,
+                embed=self._embed_for_cache,
+                semantic_threshold=(
+                    settings.llm_cache_semantic_threshold if settings.llm_cache_semantic else None
+                ),
+            )
 
-    async def generate(
+    def _build_messages(
         self,
         portfolio: PortfolioSchema,
         job: JobPosting,
-        company_info: CompanyInfo | None = None,
-    ) -> str:
-        """Generate a tailored markdown resume.
-
-        Returns the raw markdown string.
-        """
-        # Build context sections
-        portfolio_json = portfolio.model_dump_json(indent=2, exclude_none=True)
-        job_json = job.model_dump_json(indent=2, exclude_none=True)
+        company_info: CompanyInfo | None,
+    ) -> list[dict[str, str]]:
+        # Compact JSON: indentation only adds billed input tokens
+        portfolio_json = portfolio.model_dump_json(exclude_none=True)
+        job_json = job.model_dump_json(exclude_none=True)
 
         user_parts: list[str] = [
             "--- 후보자 포트폴리오 ---",
@@ -72,9 +124,7 @@ class ResumeGeneratorService:
         ]
 
         if company_info:
-            company_json = company_info.model_dump_json(
-                indent=2, exclude={"raw_text"}, exclude_none=True
-            )
+            company_json = company_info.model_dump_json(exclude={"raw_text"}, exclude_none=True)
             user_parts.append("\n--- 채용 기업 정보 (인재상 · 핵심가치) ---")
             user_parts.append(company_json)
         else:
@@ -83,28 +133,89 @@ class ResumeGeneratorService:
                 "채용공고 정보만으로 이력서를 작성해 주세요.)"
             )
 
-        user_content = "\n".join(user_parts)
+        # _SYSTEM_PROMPT goes first and verbatim: a byte-identical prefix is
+        # what lets OpenAI's automatic prompt caching reuse it across calls
+        return [
+            {"role": "system", "content": _SYSTEM_PROMPT},
+            {"role": "user", "content": "\n".join(user_parts)},
+        ]
+
+    async def generate_stream(
+        self,
+        portfolio: PortfolioSchema,
+        job: JobPosting,
+        company_info: CompanyInfo | None = None,
+    ) -> AsyncIterator[str]:
+        """Stream the tailored markdown resume as it is generated.
 
-        response = await self._client.chat.completions.create(
+        Yields raw text deltas; code-fence stripping is left to the caller
+        (see strip_code_fence).
+        """
+        stream = await self._client.chat.completions.create(
             model=self._model,
-            messages=[
-                {"role": "system", "content": _SYSTEM_PROMPT},
-                {"role": "user", "content": user_content},
-            ],
-            temperature=0.4,
+            messages=self._build_messages(portfolio, job, company_info),
+            temperature=_TEMPERATURE,
             max_tokens=4096,
+            stream=True,
+            stream_options={"include_usage": True},
         )
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+            # The final chunk carries usage and no choices
+            if chunk.usage is not None:
+                details = chunk.usage.prompt_tokens_details
+                logger.info(
+                    "Resume prompt tokens: %d (cached: %d)",
+                    chunk.usage.prompt_tokens,
+                    details.cached_tokens if details and details.cached_tokens else 0,
+                )
+
+    async def generate(
+        self,
+        portfolio: PortfolioSchema,
+        job: JobPosting,
+        company_info: CompanyInfo | None = None,
+    ) -> str:
+        """Generate a tailored markdown resume.
 
-        markdown = (response.choices[0].message.content or "").strip()
-        # Strip potential markdown code fences wrapping
-        if markdown.startswith("```"):
-            first_nl = markdown.index("\n")
-            markdown = markdown[first_nl + 1:]
-        if markdown.endswith("```"):
-            markdown = markdown[:-3].rstrip()
+        Returns the raw markdown string. With LLM_CACHE_RESUMES enabled,
+        results are cached per prompt, so regenerating for the same
+        portfolio / job / company skips the LLM call.
+        """
+        if self._cache is None:
+            markdown = await self._generate(portfolio, job, company_info)
+        else:
+            # The user message holds every per-call input; model and
+            # temperature are part of the cache namespace
+            prompt = self._build_messages(portfolio, job, company_info)[1]["content"]
+            markdown = await self._cache.get_or_compute(
+                prompt,
+                lambda: self._generate(portfolio, job, company_info),
+                embed_text=_cache_embed_text(portfolio, job, company_info),
+            )
 
         logger.info(
             "Resume generated: %d chars for job '%s' at '%s'",
             len(markdown), job.title, job.company,
         )
         return markdown
+
+    async def _generate(
+        self,
+        portfolio: PortfolioSchema,
+        job: JobPosting,
+        company_info: CompanyInfo | None,
+    ) -> str:
+        parts = [delta async for delta in self.generate_stream(portfolio, job, company_info)]
+        return strip_code_fence("".join(parts))
+
+    async def _embed_for_cache(self, text: str) -> np.ndarray:
+        """Normalised embedding of a _cache_embed_text string for the semantic cache tier."""
+        resp = await self._client.embeddings.create(
+            model=self._embed_model,
+            input=text,
+            encoding_format="base64",
+        )
+        vec = np.frombuffer(base64.b64decode(resp.data[0].embedding), dtype=np.float32)
+        return vec / max(float(np.linalg.norm(vec)), 1e-12)
@@ -4,8 +4,9 @@ Crawls saramin.co.kr search results to collect detailed job postings,
 then persists them into the crawled_jobs DB table via UPSERT.
 
 Design decisions:
-  - httpx (async) + BeautifulSoup for lightweight, Selenium-free scraping
-  - Rate-limited with configurable delays to respect server load
+  - httpx (async) + BeautifulSoup (list pages) / lxml (detail pages) for
+    lightweight, Selenium-free scraping
+  - Rate-limited by a shared limiter (MAX_REQUESTS_PER_SECOND) to respect server load
   - Each keyword is crawled across multiple pages; individual failures are skipped
   - Deduplication via source_id UNIQUE constraint (PostgreSQL ON CONFLICT DO UPDATE)
 """
@@ -13,17 +14,23 @@ Design decisions:
 from __future__ import annotations
 
 import asyncio
-import json
+import hashlib
 import logging
 import re
+import sys
 import uuid
 from datetime import datetime, timezone
 from typing import Any
 from urllib.parse import urljoin
 
 import httpx
+import lxml.html
+import orjson
 from bs4 import BeautifulSoup, Tag
-from sqlalchemy import text
+from lxml import etree
+from lxml.cssselect import CSSSelector
+from sqlalchemy import select, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import get_settings
@@ -37,6 +44,13 @@ logger = logging.getLogger(__name__)
 SARAMIN_SEARCH_URL = "https://www.saramin.co.kr/zf_user/search/recruit"
 SARAMIN_BASE = "https://www.saramin.co.kr"
 
+# Fixed search query parameters; keyword and page are filled in per request
+_SEARCH_PARAMS_BASE: dict[str, str] = {
+    "searchType": "search",
+    "recruitSort": "relation",
+    "recruitPageCount": "40",
+}
+
 # Realistic browser User-Agent to avoid bot detection
 _USER_AGENT = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -62,12 +76,17 @@ DEFAULT_KEYWORDS: list[str] = [
     "PM",
 ]
 
-# Delay between HTTP requests (seconds) to avoid rate-limiting
-REQUEST_DELAY = 1.5
+# Global cap on requests to Saramin (all keywords and pages combined); one
+# request per 1.5 s, the same courtesy bound as the old fixed REQUEST_DELAY
+MAX_REQUESTS_PER_SECOND = 1 / 1.5
 # Maximum pages to crawl per keyword
 MAX_PAGES_PER_KEYWORD = 3
 # Maximum postings to fetch per keyword (across pages)
 MAX_POSTINGS_PER_KEYWORD = 30
+# Detail pages fetched in parallel per keyword
+DETAIL_CONCURRENCY = 8
+# Keywords crawled in parallel by crawl_all_keywords
+KEYWORD_CONCURRENCY = 3
 
 
 # ── Helper Utilities ──────────────────────────────────────────
@@ -79,6 +98,34 @@ def _safe_text(tag: Tag | None) -> str:
     return tag.get_text(strip=True)
 
 
+def _safe_text_leaf(tag: Tag | None) -> str:
+    """Like _safe_text, but reads .string directly when the tag holds a single string.
+
+    Falls back to get_text() for tags with mixed children.
+    """
+    if tag is None:
+        return ""
+    string = tag.string
+    if string is not None:
+        return string.strip()
+    return tag.get_text(strip=True)
+
+
+def _intern_text(tag: Tag | None) -> str:
+    """Cleaned leaf text, interned (for low-cardinality labels)."""
+    return sys.intern(_clean_text(_safe_text_leaf(tag)))
+
+
+def _find_in(tag: Tag | None, cls: str, name: str | list[str] | None = None) -> Tag | None:
+    """First descendant with class `cls` (then, if given, its first `name` tag)."""
+    if tag is None:
+        return None
+    found = tag.find(class_=cls)
+    if found is None or name is None:
+        return found
+    return found.find(name)
+
+
 def _safe_attr(tag: Tag | None, attr: str) -> str:
     """Safely retrieve an attribute from a BS4 tag."""
     if tag is None:
@@ -86,9 +133,51 @@ def _safe_attr(tag: Tag | None, attr: str) -> str:
     return tag.get(attr, "") or ""
 
 
+_WS_RE = re.compile(r"\s+")
+# Bullet / line separators inside requirement and preference lists
+_BULLET_SPLIT_RE = re.compile(r"[·•\-\n]")
+_REC_IDX_RE = re.compile(r"rec_idx=(\d+)")
+
+
 def _clean_text(text: str) -> str:
     """Collapse whitespace and strip."""
-    return re.sub(r"\s+", " ", text).strip()
+    return _WS_RE.sub(" ", text).strip()
+
+
+_EXP_NUM_RE = re.compile(r"\d+")
+# Upper bound used for open-ended ranges ("3년↑", "경력무관")
+_EXP_MAX_YEARS = 99
+
+
+def _parse_experience_years(experience: str) -> tuple[int | None, int | None]:
+    """Parse a Saramin experience label into an inclusive (min, max) year range.
+
+    "신입" → (0, 0), "경력 3년↑" → (3, 99), "경력 1~3년" → (1, 3),
+    "신입·경력" / "경력무관" → (0, 99). Unrecognised labels → (None, None).
+    """
+    if not experience:
+        return None, None
+    if "무관" in experience:
+        return 0, _EXP_MAX_YEARS
+
+    is_entry = "신입" in experience
+    years = [int(y) for y in _EXP_NUM_RE.findall(experience)]
+    if years:
+        lo, hi = min(years), max(years)
+        if len(years) == 1:
+            if "↑" in experience or "이상" in experience:
+                hi = _EXP_MAX_YEARS
+            elif "↓" in experience or "이하" in experience:
+                lo = 0
+        if is_entry:
+            lo = 0
+        return lo, hi
+
+    if is_entry:
+        return (0, _EXP_MAX_YEARS) if "경력" in experience else (0, 0)
+    if "경력" in experience:
+        return 1, _EXP_MAX_YEARS
+    return None, None
 
 
 # ── List Page Parser ──────────────────────────────────────────
@@ -101,64 +190,72 @@ def _parse_search_results(html: str) -> list[dict[str, Any]]:
         education, employment_type, deadline, salary, url,
         tech_stack, description_snippet
     """
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, "lxml")
     items: list[dict[str, Any]] = []
 
     # Saramin wraps each job card in a div with class "item_recruit"
-    job_cards = soup.select(".item_recruit")
+    # find/find_all with tag+class args skip soupsieve selector compilation
+    job_cards = soup.find_all(class_="item_recruit")
 
     for card in job_cards:
         try:
             # Extract unique recruit ID from the card's data-rec_idx or link
-            link_tag = card.select_one(".job_tit a")
+            link_tag = _find_in(card, "job_tit", "a")
             if not link_tag:
                 continue
 
             href = _safe_attr(link_tag, "href")
             # Recruit ID is embedded in the href, e.g. /zf_user/jobs/relay/view?rec_idx=12345
-            rec_match = re.search(r"rec_idx=(\d+)", href)
+            rec_match = _REC_IDX_RE.search(href)
             source_id = rec_match.group(1) if rec_match else uuid.uuid4().hex[:12]
             detail_url = urljoin(SARAMIN_BASE, href) if href else None
 
             # Job title
-            title = _clean_text(_safe_text(link_tag))
+            title = _clean_text(_safe_text_leaf(link_tag))
 
             # Company name
-            company_tag = card.select_one(".corp_name a, .corp_name span")
+            company_tag = _find_in(card, "corp_name", ["a", "span"])
             company = _clean_text(_safe_text(company_tag))
 
             # Job condition badges (location, experience, education, employment type)
-            conditions = card.select(".job_condition span")
-            location = _clean_text(_safe_text(conditions[0])) if len(conditions) > 0 else ""
-            experience = _clean_text(_safe_text(conditions[1])) if len(conditions) > 1 else ""
-            education = _clean_text(_safe_text(conditions[2])) if len(conditions) > 2 else ""
-            employment_type = _clean_text(_safe_text(conditions[3])) if len(conditions) > 3 else ""
+            condition_tag = _find_in(card, "job_condition")
+            conditions = condition_tag.find_all("span") if condition_tag is not None else []
+            # Few distinct values ("서울 강남구", "신입", "정규직", …) repeat across
+            # thousands of cards: intern them so equal labels share one object
+            location = _intern_text(conditions[0]) if len(conditions) > 0 else ""
+            experience = _intern_text(conditions[1]) if len(conditions) > 1 else ""
+            education = _intern_text(conditions[2]) if len(conditions) > 2 else ""
+            employment_type = _intern_text(conditions[3]) if len(conditions) > 3 else ""
 
             # Salary info (may not always be present)
-            salary_tag = card.select_one(".area_job .job_salary")
-            salary = _clean_text(_safe_text(salary_tag)) if salary_tag else ""
+            salary_tag = _find_in(_find_in(card, "area_job"), "job_salary")
+            salary = _clean_text(_safe_text_leaf(salary_tag)) if salary_tag else ""
 
             # Deadline
-            deadline_tag = card.select_one(".job_date .date")
-            deadline = _clean_text(_safe_text(deadline_tag))
+            deadline_tag = _find_in(_find_in(card, "job_date"), "date")
+            deadline = _clean_text(_safe_text_leaf(deadline_tag))
 
             # Tech stack / sector tags
-            sector_tags = card.select(".job_sector a, .job_sector span")
-            tech_stack = [_clean_text(_safe_text(t)) for t in sector_tags if _safe_text(t)]
+            desc_tag = _find_in(card, "job_sector")
+            sector_tags = desc_tag.find_all(["a", "span"]) if desc_tag is not None else []
+            tech_stack = [sys.intern(_clean_text(_safe_text(t))) for t in sector_tags if _safe_text(t)]
 
             # Short description snippet from the card
-            desc_tag = card.select_one(".job_sector")
             description_snippet = _clean_text(_safe_text(desc_tag)) if desc_tag else ""
 
             if not title or not company:
                 continue
 
+            exp_min, exp_max = _parse_experience_years(experience)
+
             items.append({
                 "source_id": f"saramin-{source_id}",
                 "title": title,
                 "company": company,
                 "location": location,
                 "experience": experience,
+                "experience_min_years": exp_min,
+                "experience_max_years": exp_max,
                 "education": education,
                 "employment_type": employment_type,
                 "deadline": deadline,
@@ -176,13 +273,58 @@ def _parse_search_results(html: str) -> list[dict[str, Any]]:
 
 # ── Detail Page Parser ────────────────────────────────────────
 
+# Detail pages are parsed with lxml directly (no BeautifulSoup tree);
+# selectors are translated to XPath once at import.
+# Saramin detail pages use various containers for the JD body
+_JD_SELECTORS = tuple(CSSSelector(sel, translator="html") for sel in (
+    ".jv_cont.jv_detail .cont",             # standard template
+    ".jv_cont .jv_detail",                   # alternate layout
+    ".wrap_jv_cont .jv_detail",              # another variant
+    "#job_description",                       # some companies
+    ".job_description",
+))
+_JV_CONT_SELECTOR = CSSSelector(".jv_cont", translator="html")
+_SUMMARY_DL_SELECTOR = CSSSelector(".jv_cont .cont dl, .jv_summary dl", translator="html")
+_STACK_TAG_SELECTOR = CSSSelector(".jv_cont .job_skill span, .skill_list span", translator="html")
+
+# <dt> labels of the summary sections, one alternation scan each
+# ("지원자격" is covered by "자격")
+_REQ_KEYS_RE = re.compile(r"자격|필수|경력|요건")
+_PREF_KEYS_RE = re.compile(r"우대|preferred", re.IGNORECASE)
+_SALARY_KEYS_RE = re.compile(r"급여|연봉")
+
+_DETAIL_REGION_MARKERS = ("wrap_jv_cont", "jv_cont", "jv_summary", "job_description")
+
+
+def _trim_detail_html(html: str) -> str:
+    """Cut the page down to the span from the first JD region to <footer.
+
+    Saves tokenising the large header / nav / script prefix. Falls back to
+    the full page when no region marker is present.
+    """
+    hits = [i for i in (html.find(m) for m in _DETAIL_REGION_MARKERS) if i >= 0]
+    if not hits:
+        return html
+    start = html.rfind("<", 0, min(hits))
+    if start < 0:
+        return html
+    end = html.find("<footer", start)
+    return html[start:end] if end > 0 else html[start:]
+
+
+def _element_text(el: etree._Element | None, separator: str = "") -> str:
+    """Stripped, non-empty text pieces of an element joined by separator."""
+    if el is None:
+        return ""
+    return separator.join(t for t in (text.strip() for text in el.itertext()) if t)
+
+
 def _parse_detail_page(html: str) -> dict[str, Any]:
     """Parse a Saramin job detail page for full JD text and structured fields.
 
     Returns dict with keys:
         description, requirements, preferred, salary, tech_stack
     """
-    soup = BeautifulSoup(html, "html.parser")
     result: dict[str, Any] = {
         "description": "",
         "requirements": [],
@@ -191,59 +333,105 @@ def _parse_detail_page(html: str) -> dict[str, Any]:
         "tech_stack": [],
     }
 
+    try:
+        tree = lxml.html.fromstring(_trim_detail_html(html))
+    except (etree.ParserError, ValueError) as e:
+        logger.debug("Failed to parse detail page: %s", e)
+        return result
+    # Text of comments, scripts and styles is not page content
+    etree.strip_elements(tree, etree.Comment, "script", "style", with_tail=False)
+
     # ── Full job description text ──
-    # Saramin detail pages use various containers for the JD body
-    jd_selectors = [
-        ".jv_cont.jv_detail .cont",             # standard template
-        ".jv_cont .jv_detail",                   # alternate layout
-        ".wrap_jv_cont .jv_detail",              # another variant
-        "#job_description",                       # some companies
-        ".job_description",
-    ]
-    for sel in jd_selectors:
-        jd_block = soup.select_one(sel)
-        if jd_block and len(jd_block.get_text(strip=True)) > 50:
-            result["description"] = _clean_text(jd_block.get_text(separator="\n", strip=True))[:5000]
+    for sel in _JD_SELECTORS:
+        matches = sel(tree)
+        if not matches:
+            continue
+        # One traversal: the extracted text doubles as the length check
+        jd_text = _element_text(matches[0], "\n")
+        if len(jd_text) > 50:
+            result["description"] = _clean_text(jd_text)[:5000]
             break
 
     # If no structured JD found, grab the whole .jv_cont area
     if not result["description"]:
-        jv_cont = soup.select_one(".jv_cont")
+        jv_cont = _JV_CONT_SELECTOR(tree)
         if jv_cont:
-            result["description"] = _clean_text(jv_cont.get_text(separator="\n", strip=True))[:5000]
+            result["description"] = _clean_text(_element_text(jv_cont[0], "\n"))[:5000]
 
     # ── Structured sections: requirements / preferred ──
     # Some pages have dl/dt/dd pairs in .jv_summary or .cont
-    summary_sections = soup.select(".jv_cont .cont dl, .jv_summary dl")
+    summary_sections = _SUMMARY_DL_SELECTOR(tree)
     for dl in summary_sections:
-        dt = _safe_text(dl.find("dt")).strip()
-        dd = _safe_text(dl.find("dd")).strip()
+        dt = _element_text(dl.find(".//dt"))
+        dd = _element_text(dl.find(".//dd"))
         if not dt or not dd:
             continue
 
-        lower_dt = dt.lower()
-        if any(k in lower_dt for k in ["자격", "필수", "경력", "요건", "지원자격"]):
+        if _REQ_KEYS_RE.search(dt):
             # Split by newline or bullet characters
-            items = re.split(r"[·•\-\n]", dd)
+            items = _BULLET_SPLIT_RE.split(dd)
             result["requirements"].extend([_clean_text(i) for i in items if _clean_text(i)])
-        elif any(k in lower_dt for k in ["우대", "preferred"]):
-            items = re.split(r"[·•\-\n]", dd)
+        elif _PREF_KEYS_RE.search(dt):
+            items = _BULLET_SPLIT_RE.split(dd)
             result["preferred"].extend([_clean_text(i) for i in items if _clean_text(i)])
-        elif "급여" in lower_dt or "연봉" in lower_dt:
+        elif _SALARY_KEYS_RE.search(dt):
             result["salary"] = _clean_text(dd)
 
     # ── Tech stack tags from detail page ──
-    stack_tags = soup.select(".jv_cont .job_skill span, .skill_list span")
+    stack_tags = _STACK_TAG_SELECTOR(tree)
     if stack_tags:
-        result["tech_stack"] = [_clean_text(_safe_text(t)) for t in stack_tags if _safe_text(t)]
+        texts = (_element_text(t) for t in stack_tags)
+        result["tech_stack"] = [sys.intern(_clean_text(t)) for t in texts if t]
 
     return result
 
 
 # ── HTTP Client ───────────────────────────────────────────────
 
+class _RateLimiter:
+    """Spaces request starts at least 1/rate seconds apart.
+
+    Unlike a fixed sleep after each response, time spent waiting on the
+    network counts toward the interval. Slots are reserved synchronously,
+    so concurrent callers need no lock.
+    """
+
+    def __init__(self, rate: float) -> None:
+        self._interval = 1.0 / rate
+        self._next_slot = 0.0
+
+    async def wait(self) -> None:
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self._interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+_RATE_LIMITER = _RateLimiter(MAX_REQUESTS_PER_SECOND)
+
+
+def _new_client() -> httpx.AsyncClient:
+    """HTTP client configured for Saramin (browser headers, pooled connections)."""
+    # HTTP/2 multiplexes the concurrent detail fetches over one connection;
+    # httpx already negotiates gzip/deflate
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=20,
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=16, max_keepalive_connections=16),
+        headers={
+            "User-Agent": _USER_AGENT,
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+            "Referer": "https://www.saramin.co.kr/",
+        },
+    )
+
+
 async def _fetch_html(client: httpx.AsyncClient, url: str, params: dict | None = None) -> str | None:
     """Fetch a page and return HTML text; return None on failure."""
+    await _RATE_LIMITER.wait()
     try:
         resp = await client.get(url, params=params)
         resp.raise_for_status()
@@ -258,47 +446,85 @@ async def _fetch_html(client: httpx.AsyncClient, url: str, params: dict | None =
 
 # ── DB Persistence (UPSERT) ──────────────────────────────────
 
+# Columns refreshed from the new crawl when a source_id already exists
+_UPSERT_UPDATE_COLUMNS = (
+    "title", "company", "location", "description",
+    "requirements_json", "preferred_json", "salary", "url",
+    "experience", "experience_min_years", "experience_max_years",
+    "education", "employment_type", "deadline", "tech_stack_json",
+    "content_hash", "crawled_at", "is_active",
+)
+# Filled only from the detail page: card-only rows leave the stored values alone
+_DETAIL_COLUMNS = frozenset({"description", "requirements_json", "preferred_json"})
+
+# Row fields covered by content_hash (everything but ids and crawl bookkeeping)
+_HASHED_COLUMNS = (
+    "title", "company", "location", "description",
+    "requirements_json", "preferred_json", "salary", "url",
+    "experience", "experience_min_years", "experience_max_years",
+    "education", "employment_type", "deadline", "tech_stack_json",
+)
+
+
+def _content_hash(row: dict[str, Any]) -> int:
+    """Signed 64-bit digest of a row's content, matching a BIGINT column."""
+    payload = orjson.dumps([row[col] for col in _HASHED_COLUMNS])
+    return int.from_bytes(hashlib.blake2b(payload, digest_size=8).digest(), "big", signed=True)
+
+
+def _build_upsert_stmt(columns: tuple[str, ...] = _UPSERT_UPDATE_COLUMNS):
+    stmt = pg_insert(CrawledJob)
+    return stmt.on_conflict_do_update(
+        index_elements=[CrawledJob.source_id],
+        set_={col: stmt.excluded[col] for col in columns},
+        # Guard for rows that changed between the pre-select and the write
+        where=CrawledJob.content_hash.is_distinct_from(stmt.excluded.content_hash),
+    )
+
+
+# Built once with no VALUES: executed with a list of parameter dicts it
+# takes SQLAlchemy's executemany path, so the statement is compiled once
+# (compiled cache) and asyncpg reuses its prepared statement
+_UPSERT_STMT = _build_upsert_stmt()
+# Same, for rows without detail-page data: updates the card columns only
+_CARD_UPSERT_STMT = _build_upsert_stmt(
+    tuple(col for col in _UPSERT_UPDATE_COLUMNS if col not in _DETAIL_COLUMNS)
+)
+# Rows whose source_id is not stored yet: plain insert, no update work.
+# DO NOTHING only covers a concurrent insert of the same posting.
+_INSERT_NEW_STMT = pg_insert(CrawledJob).on_conflict_do_nothing(
+    index_elements=[CrawledJob.source_id],
+)
+# Rows per execute; larger batches stop paying off in PostgreSQL
+_UPSERT_BATCH_SIZE = 1000
+
+
 async def _upsert_jobs(db: AsyncSession, jobs: list[dict[str, Any]]) -> int:
     """Insert or update crawled jobs using PostgreSQL ON CONFLICT.
 
+    Per batch of _UPSERT_BATCH_SIZE rows, the already-stored source_ids and
+    content hashes are looked up first: new postings take the cheap
+    _INSERT_NEW_STMT, changed ones the ON CONFLICT DO UPDATE of _UPSERT_STMT,
+    and unchanged ones only get crawled_at / is_active refreshed. Changed
+    jobs without detail-page data go through _CARD_UPSERT_STMT, which keeps
+    the stored description / requirements / preferred. All batches are
+    committed once at the end.
     Returns number of rows affected.
     """
     if not jobs:
         return 0
 
-    upserted = 0
-    for job in jobs:
-        stmt = text("""
-            INSERT INTO crawled_jobs (
-                id, source, source_id, title, company, location,
-                description, requirements_json, preferred_json,
-                salary, url, experience, education, employment_type,
-                deadline, tech_stack_json, crawled_at, is_active
-            ) VALUES (
-                :id, :source, :source_id, :title, :company, :location,
-                :description, :requirements_json, :preferred_json,
-                :salary, :url, :experience, :education, :employment_type,
-                :deadline, :tech_stack_json, :crawled_at, :is_active
-            )
-            ON CONFLICT (source_id) DO UPDATE SET
-                title = EXCLUDED.title,
-                company = EXCLUDED.company,
-                location = EXCLUDED.location,
-                description = EXCLUDED.description,
-                requirements_json = EXCLUDED.requirements_json,
-                preferred_json = EXCLUDED.preferred_json,
-                salary = EXCLUDED.salary,
-                url = EXCLUDED.url,
-                experience = EXCLUDED.experience,
-                education = EXCLUDED.education,
-                employment_type = EXCLUDED.employment_type,
-                deadline = EXCLUDED.deadline,
-                tech_stack_json = EXCLUDED.tech_stack_json,
-                crawled_at = EXCLUDED.crawled_at,
-                is_active = EXCLUDED.is_active
-        """)
-
-        await db.execute(stmt, {
+    # One row per source_id (a multi-row ON CONFLICT cannot touch the same
+    # row twice), in a fixed order so concurrent keyword upserts lock
+    # overlapping rows in the same sequence instead of deadlocking
+    jobs = sorted({job["source_id"]: job for job in jobs}.values(), key=lambda j: j["source_id"])
+    # Card-only data (detail skipped, disabled or failed)
+    card_only_ids = {job["source_id"] for job in jobs if not job.get("has_details")}
+
+    # One timestamp for the whole batch: every row was crawled in this run
+    now = datetime.now(timezone.utc)
+    rows = [
+        {
             "id": uuid.uuid4().hex,
             "source": job.get("source", "saramin"),
             "source_id": job["source_id"],
@@ -306,31 +532,91 @@ async def _upsert_jobs(db: AsyncSession, jobs: list[dict[str, Any]]) -> int:
             "company": job["company"],
             "location": job.get("location") or None,
             "description": job.get("description") or None,
-            "requirements_json": json.dumps(job.get("requirements", []), ensure_ascii=False),
-            "preferred_json": json.dumps(job.get("preferred", []), ensure_ascii=False),
+            "requirements_json": job.get("requirements", []),
+            "preferred_json": job.get("preferred", []),
             "salary": job.get("salary") or None,
             "url": job.get("url") or None,
             "experience": job.get("experience") or None,
+            "experience_min_years": job.get("experience_min_years"),
+            "experience_max_years": job.get("experience_max_years"),
             "education": job.get("education") or None,
             "employment_type": job.get("employment_type") or None,
             "deadline": job.get("deadline") or None,
-            "tech_stack_json": json.dumps(job.get("tech_stack", []), ensure_ascii=False),
-            "crawled_at": datetime.now(timezone.utc),
+            "tech_stack_json": job.get("tech_stack", []),
+            "crawled_at": now,
             "is_active": 1,
-        })
-        upserted += 1
+        }
+        for job in jobs
+    ]
+    for row in rows:
+        row["content_hash"] = _content_hash(row)
+
+    for start in range(0, len(rows), _UPSERT_BATCH_SIZE):
+        batch = rows[start:start + _UPSERT_BATCH_SIZE]
+        stored = dict((await db.execute(
+            select(CrawledJob.source_id, CrawledJob.content_hash).where(
+                CrawledJob.source_id.in_([row["source_id"] for row in batch])
+            )
+        )).tuples().all())
+        new_rows: list[dict[str, Any]] = []
+        changed_rows: list[dict[str, Any]] = []
+        changed_card_rows: list[dict[str, Any]] = []
+        unchanged_ids: list[str] = []
+        for row in batch:
+            if row["source_id"] not in stored:
+                new_rows.append(row)
+            elif stored[row["source_id"]] == row["content_hash"]:
+                unchanged_ids.append(row["source_id"])
+            elif row["source_id"] in card_only_ids:
+                changed_card_rows.append(row)
+            else:
+                changed_rows.append(row)
+
+        if new_rows:
+            await db.execute(_INSERT_NEW_STMT, new_rows)
+        if changed_rows:
+            await db.execute(_UPSERT_STMT, changed_rows)
+        if changed_card_rows:
+            await db.execute(_CARD_UPSERT_STMT, changed_card_rows)
+        if unchanged_ids:
+            # Still seen on Saramin: keep it active and fresh for expiry checks
+            await db.execute(
+                update(CrawledJob)
+                .where(CrawledJob.source_id.in_(unchanged_ids))
+                .values(crawled_at=now, is_active=1)
+            )
 
     await db.commit()
-    return upserted
+    return len(rows)
 
 
 # ── Main Crawl Orchestrator ───────────────────────────────────
 
+def _merge_detail(job: dict[str, Any], detail_data: dict[str, Any]) -> None:
+    """Merge detail-page data into the job dict (detail overwrites snippet)."""
+    job["has_details"] = True
+    if detail_data["description"]:
+        job["description"] = detail_data["description"]
+    else:
+        # Fall back to the snippet from the list page
+        job["description"] = job.get("description_snippet", "")
+    if detail_data["requirements"]:
+        job["requirements"] = detail_data["requirements"]
+    if detail_data["preferred"]:
+        job["preferred"] = detail_data["preferred"]
+    if detail_data["salary"]:
+        job["salary"] = detail_data["salary"]
+    if detail_data["tech_stack"]:
+        job["tech_stack"] = detail_data["tech_stack"]
+
+
 async def crawl_saramin_keyword(
     keyword: str,
     max_pages: int = MAX_PAGES_PER_KEYWORD,
     max_postings: int = MAX_POSTINGS_PER_KEYWORD,
     fetch_details: bool = True,
+    client: httpx.AsyncClient | None = None,
+    detail_skip_min_tags: int = 0,
 ) -> list[dict[str, Any]]:
     """Crawl Saramin search results for a single keyword.
 
@@ -345,77 +631,64 @@ async def crawl_saramin_keyword(
         max_pages: max number of search result pages to crawl
         max_postings: cap on total postings per keyword
         fetch_details: if True, visit each posting's detail page for full JD
+        client: shared HTTP client (see _new_client); one is created if omitted
+        detail_skip_min_tags: skip the detail page of cards with at least
+            this many tech tags; 0 fetches every detail page (stored JD
+            columns are never overwritten with card-only data)
     """
+    if client is None:
+        async with _new_client() as own_client:
+            return await crawl_saramin_keyword(
+                keyword, max_pages, max_postings, fetch_details,
+                client=own_client, detail_skip_min_tags=detail_skip_min_tags,
+            )
+
     all_jobs: list[dict[str, Any]] = []
 
-    async with httpx.AsyncClient(
-        timeout=20,
-        follow_redirects=True,
-        headers={
-            "User-Agent": _USER_AGENT,
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
-            "Referer": "https://www.saramin.co.kr/",
-        },
-    ) as client:
-
-        # ── Phase 1: Crawl search result list pages ──
-        for page in range(1, max_pages + 1):
-            if len(all_jobs) >= max_postings:
-                break
-
-            params = {
-                "searchType": "search",
-                "searchword": keyword,
-                "recruitPage": str(page),
-                "recruitSort": "relation",
-                "recruitPageCount": "40",
-            }
-
-            logger.info("Crawling Saramin search: keyword='%s' page=%d", keyword, page)
-            html = await _fetch_html(client, SARAMIN_SEARCH_URL, params=params)
-            if not html:
-                logger.warning("Empty response for keyword='%s' page=%d", keyword, page)
-                break
-
-            page_jobs = _parse_search_results(html)
-            if not page_jobs:
-                logger.info("No results on page %d for keyword='%s'", page, keyword)
-                break
-
-            all_jobs.extend(page_jobs)
-            await asyncio.sleep(REQUEST_DELAY)
-
-        # Trim to max
-        all_jobs = all_jobs[:max_postings]
-
-        # ── Phase 2: Fetch detail pages for each posting ──
-        if fetch_details:
-            for i, job in enumerate(all_jobs):
-                detail_url = job.get("url")
-                if not detail_url:
-                    continue
-
-                logger.debug("Fetching detail %d/%d: %s", i + 1, len(all_jobs), detail_url)
-                detail_html = await _fetch_html(client, detail_url)
+    # ── Phase 1: Crawl search result list pages ──
+    for page in range(1, max_pages + 1):
+        if len(all_jobs) >= max_postings:
+            break
+
+        params = {**_SEARCH_PARAMS_BASE, "searchword": keyword, "recruitPage": str(page)}
+
+        logger.info("Crawling Saramin search: keyword='%s' page=%d", keyword, page)
+        html = await _fetch_html(client, SARAMIN_SEARCH_URL, params=params)
+        if not html:
+            logger.warning("Empty response for keyword='%s' page=%d", keyword, page)
+            break
+
+        # Parsing is CPU-bound; keep the event loop free for other I/O
+        page_jobs = await asyncio.to_thread(_parse_search_results, html)
+        if not page_jobs:
+            logger.info("No results on page %d for keyword='%s'", page, keyword)
+            break
+
+        all_jobs.extend(page_jobs)
+
+    # Trim to max
+    all_jobs = all_jobs[:max_postings]
+
+    # ── Phase 2: Fetch detail pages concurrently (bounded) ──
+    if fetch_details:
+        sem = asyncio.Semaphore(DETAIL_CONCURRENCY)
+        detail_jobs: list[dict[str, Any]] = []
+        for job in all_jobs:
+            if not job.get("url"):
+                continue
+            if detail_skip_min_tags and len(job["tech_stack"]) >= detail_skip_min_tags:
+                continue
+            detail_jobs.append(job)
+
+        async def fetch_detail(i: int, job: dict[str, Any]) -> None:
+            async with sem:
+                logger.debug("Fetching detail %d/%d: %s", i + 1, len(detail_jobs), job["url"])
+                detail_html = await _fetch_html(client, job["url"])
                 if detail_html:
-                    detail_data = _parse_detail_page(detail_html)
-                    # Merge detail data into the job dict (detail overwrites snippet)
-                    if detail_data["description"]:
-                        job["description"] = detail_data["description"]
-                    else:
-                        # Fall back to the snippet from the list page
-                        job["description"] = job.get("description_snippet", "")
-                    if detail_data["requirements"]:
-                        job["requirements"] = detail_data["requirements"]
-                    if detail_data["preferred"]:
-                        job["preferred"] = detail_data["preferred"]
-                    if detail_data["salary"]:
-                        job["salary"] = detail_data["salary"]
-                    if detail_data["tech_stack"]:
-                        job["tech_stack"] = detail_data["tech_stack"]
-
-                await asyncio.sleep(REQUEST_DELAY)
+                    detail_data = await asyncio.to_thread(_parse_detail_page, detail_html)
+                    _merge_detail(job, detail_data)
+
+        await asyncio.gather(*(fetch_detail(i, job) for i, job in enumerate(detail_jobs)))
 
     # Ensure all jobs have the source field
     for job in all_jobs:
@@ -443,30 +716,43 @@ async def crawl_all_keywords(
         kw_str = settings.crawl_keywords
         keywords = [k.strip() for k in kw_str.split(",") if k.strip()] if kw_str else DEFAULT_KEYWORDS
 
-    total_upserted = 0
-    total_crawled = 0
-
-    for keyword in keywords:
-        try:
-            jobs = await crawl_saramin_keyword(
-                keyword=keyword,
-                max_pages=max_pages,
-                max_postings=max_postings_per_kw,
-                fetch_details=fetch_details,
-            )
-            total_crawled += len(jobs)
-
-            if jobs:
+    sem = asyncio.Semaphore(KEYWORD_CONCURRENCY)
+
+    async def run_keyword(keyword: str, client: httpx.AsyncClient) -> tuple[int, int]:
+        """Crawl and persist one keyword; returns (crawled, upserted)."""
+        async with sem:
+            try:
+                jobs = await crawl_saramin_keyword(
+                    keyword=keyword,
+                    max_pages=max_pages,
+                    max_postings=max_postings_per_kw,
+                    fetch_details=fetch_details,
+                    client=client,
+                    detail_skip_min_tags=settings.crawl_detail_skip_min_tags,
+                )
+                if not jobs:
+                    return 0, 0
                 async with async_session() as db:
                     count = await _upsert_jobs(db, jobs)
-                    total_upserted += count
-                    logger.info(
-                        "Keyword '%s': crawled=%d, upserted=%d",
-                        keyword, len(jobs), count,
-                    )
-        except Exception as e:
-            logger.error("Crawl failed for keyword '%s': %s", keyword, e)
-            continue
+                logger.info(
+                    "Keyword '%s': crawled=%d, upserted=%d",
+                    keyword, len(jobs), count,
+                )
+                return len(jobs), count
+            except Exception as e:
+                logger.error("Crawl failed for keyword '%s': %s", keyword, e)
+                return 0, 0
+
+    # Keywords share one client (connection pool) and the global rate limiter
+    async with _new_client() as client:
+        results = await asyncio.gather(*(run_keyword(kw, client) for kw in keywords))
+
+    total_crawled = sum(crawled for crawled, _ in results)
+    total_upserted = sum(upserted for _, upserted in results)
+
+    if total_upserted:
+        from app.services.job_fetcher import clear_job_cache
+        clear_job_cache()
 
     logger.info(
         "Saramin crawl complete: keywords=%d, crawled=%d, upserted=%d",
@@ -503,5 +789,7 @@ async def deactivate_expired_jobs() -> int:
         count = result.rowcount or 0
 
     if count:
+        from app.services.job_fetcher import clear_job_cache
+        clear_job_cache()
         logger.info("Deactivated %d expired job postings", count)
     return count
@@ -1,6 +1,6 @@
 """Drop and recreate all database tables. Use for dev only."""
 import asyncio
-from app.db.database import engine, Base
+from app.db.database import engine, Base, apply_schema_upgrades
 from app.db import models  # noqa: F401 – registers ORM models
 
 
@@ -8,6 +8,7 @@ async def main():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
         await conn.run_sync(Base.metadata.create_all)
+    await apply_schema_upgrades(models.SCHEMA_UPGRADES)
     await engine.dispose()
     print("All tables recreated successfully.")
 
@@ -7,7 +7,7 @@ import remarkGfm from "remark-gfm";
 import Navigation from "@/components/Navigation";
 import AuthGuard from "@/components/AuthGuard";
 import {
-  generateResume,
+  generateResumeStream,
   downloadResumePdf,
   getResume,
   type ResumeResponse,
@@ -31,6 +31,7 @@ function ResumeContent() {
   const [error, setError] = useState<string | null>(null);
   const [result, setResult] = useState<ResumeResponse | null>(null);
   const [pdfLoading, setPdfLoading] = useState(false);
+  const [streaming, setStreaming] = useState(false);
 
   useEffect(() => {
     if (resumeId && !result) {
@@ -60,12 +61,20 @@ function ResumeContent() {
     setLoading(true);
     setError(null);
     try {
-      const resp = await generateResume(portfolioId, jobId);
-      setResult(resp);
+      // Show the resume as it is written, then swap in the stored version
+      let text = "";
+      const id = await generateResumeStream(portfolioId, jobId, (delta) => {
+        text += delta;
+        setLoading(false);
+        setStreaming(true);
+        setResult({ id: "", markdown_content: text, crawl_success: true });
+      });
+      setResult(await getResume(id));
     } catch (e: unknown) {
       setError(e instanceof Error ? e.message : "이력서 생성에 실패했습니다.");
     } finally {
       setLoading(false);
+      setStreaming(false);
     }
   };
 
@@ -169,7 +178,7 @@ function ResumeContent() {
                 <div className="flex flex-wrap gap-2 sm:gap-3">
                   <button
                     onClick={handlePdfDownload}
-                    disabled={pdfLoading}
+                    disabled={pdfLoading || streaming}
                     className="flex-1 sm:flex-none inline-flex items-center justify-center px-5 py-3 bg-emerald-600 text-white font-semibold text-sm rounded-xl shadow-sm shadow-emerald-600/25 hover:bg-emerald-700 disabled:opacity-50 transition-all duration-200"
                   >
                     {pdfLoading ? (
@@ -199,7 +208,7 @@ function ResumeContent() {
                   </button>
                   <button
                     onClick={handleGenerate}
-                    disabled={loading}
+                    disabled={loading || streaming}
                     className="w-full sm:w-auto btn-ghost text-emerald-700 hover:bg-emerald-50"
                   >
                     다시 생성
@@ -335,6 +335,41 @@ export async function generateResume(
   });
 }
 
+/**
+ * Streaming variant of generateResume: onDelta receives the markdown as it is
+ * generated. Resolves with the resume id once the stream ends; fetch the
+ * stored resume with getResume for the final markdown and company info.
+ */
+export async function generateResumeStream(
+  portfolioId: string,
+  jobId: string,
+  onDelta: (text: string) => void,
+  companyUrl?: string
+): Promise<string> {
+  const authHeaders = getAuthHeaders();
+  const res = await fetch(`${BASE}/resume/generate/stream`, {
+    method: "POST",
+    headers: { "Content-Type": "application/json", ...authHeaders },
+    body: JSON.stringify({
+      portfolio_id: portfolioId,
+      job_id: jobId,
+      company_url: companyUrl || null,
+    }),
+  });
+  const resumeId = res.headers.get("X-Resume-Id");
+  if (!res.ok || !res.body || !resumeId) {
+    const body = await res.text();
+    throw new Error(`API ${res.status}: ${body}`);
+  }
+  const reader = res.body.pipeThrough(new TextDecoderStream()).getReader();
+  for (;;) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    onDelta(value);
+  }
+  return resumeId;
+}
+
 export async function getResume(resumeId: string): Promise<ResumeResponse> {
   return request<ResumeResponse>(`/resume/${resumeId}`);
 }